@@ -7,7 +7,8 @@ Agents just return LangChain messages, reducer handles the rest.
 """
 
 from typing import Dict, Any
-from langchain_core.messages import SystemMessage
+from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
+from framework import InteractiveCommandHandler, MemoryInspector, to_langchain_messages
 
 
 def init_conversation_agent(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -19,9 +20,6 @@ def init_conversation_agent(state: Dict[str, Any]) -> Dict[str, Any]:
     - No MemoryManager calls needed!
     - Config was loaded in workflow.py, reducer handles everything
     """
-    import os
-    from framework import MemoryInspector
-    
     num_emails = len(state.get('emails', []))
     num_slack = len(state.get('slack_messages', []))
     total = num_emails + num_slack
@@ -73,8 +71,6 @@ def get_user_input_agent(state: Dict[str, Any]) -> Dict[str, Any]:
     - status, export, help, exit are handled automatically
     - Only need to handle regular queries here!
     """
-    from framework import InteractiveCommandHandler
-    
     try:
         query = input("\n👤 You: ").strip()
         
@@ -185,8 +181,6 @@ def generate_response_agent(state: Dict[str, Any]) -> Dict[str, Any]:
     - Zero explicit MemoryManager calls!
     """
     from langchain_ollama import ChatOllama
-    from langchain_core.messages import HumanMessage, AIMessage
-    from framework import to_langchain_messages
     
     print("   🤖 Generating response...")
     
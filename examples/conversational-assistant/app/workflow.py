@@ -5,6 +5,7 @@ Ask questions about your emails and Slack messages in natural language
 Uses framework's AUTOMATIC memory management - configure once, forget forever!
 """
 
+from functools import lru_cache
 from typing import TypedDict, List, Dict, Annotated
 from langgraph.graph import START, END
 from framework import (
@@ -53,10 +54,21 @@ class ConversationalStateBase(ConversationMemoryMixin):
     errors: List[str]
 
 
+# ============================================================================
+# Routing
+# ============================================================================
+
+def route_display(state: ConversationalStateBase) -> str:
+    """Loop back for another turn unless the user asked to stop"""
+    # continue_chat is set on every path through get_input_agent
+    return "continue" if state["continue_chat"] else "end"
+
+
 # ============================================================================
 # Workflow Builder
 # ============================================================================
 
+@lru_cache(maxsize=1)
 def build_workflow():
     """
     Builds the conversational assistant workflow with short-term memory
@@ -70,6 +82,9 @@ def build_workflow():
        - Generate response with LLM
        - Display and check if continue
     
+    The graph structure has no per-run state, so it is built once per process
+    and the same graph is returned on later calls.
+    
     Returns:
         Uncompiled workflow (framework adds checkpointer)
     """
@@ -143,7 +158,7 @@ def build_workflow():
     # Conditional: continue conversation or end
     workflow.add_conditional_edges(
         "display",
-        lambda state: "continue" if state.get('continue_chat', False) else "end",
+        route_display,
         {
             "continue": "get_input",  # Loop back to get next query
             "end": END
@@ -13,36 +13,39 @@ from datetime import datetime
 # Mock Data
 # ============================================================================
 
+# One clock read shared by every mock row
+_MOCK_TIMESTAMP = datetime.now().isoformat()
+
 MOCK_EMAILS = [
     {
         'from': 'alice@example.com',
         'subject': 'Urgent: Project deadline moved to Friday',
         'body': 'Hi team, the project deadline has been moved up to this Friday. We need to prioritize the remaining tasks. Can you review the draft by Wednesday?',
-        'timestamp': datetime.now().isoformat()
+        'timestamp': _MOCK_TIMESTAMP
     },
     {
         'from': 'bob@company.com',
         'subject': 'Quick question about the API',
         'body': 'Hey, I noticed the API endpoint is returning a 500 error. Can you take a look when you get a chance? Not urgent but would be good to fix.',
-        'timestamp': datetime.now().isoformat()
+        'timestamp': _MOCK_TIMESTAMP
     },
     {
         'from': 'carol@startup.io',
         'subject': 'Meeting request for next week',
         'body': 'Would you be available for a 30-minute call next Tuesday to discuss the integration? Let me know what time works for you.',
-        'timestamp': datetime.now().isoformat()
+        'timestamp': _MOCK_TIMESTAMP
     },
     {
         'from': 'notifications@github.com',
         'subject': '[Repo] New pull request opened',
         'body': 'A new pull request has been opened on your repository. Please review when you have time.',
-        'timestamp': datetime.now().isoformat()
+        'timestamp': _MOCK_TIMESTAMP
     },
     {
         'from': 'david@partner.com',
         'subject': 'Critical: Production deployment failed',
         'body': 'The production deployment failed at 3am. We need to roll back immediately and investigate. Please respond ASAP!',
-        'timestamp': datetime.now().isoformat()
+        'timestamp': _MOCK_TIMESTAMP
     }
 ]
 
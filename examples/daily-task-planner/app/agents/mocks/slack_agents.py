@@ -13,48 +13,51 @@ from datetime import datetime
 # Mock Data
 # ============================================================================
 
+# One clock read shared by every mock row
+_MOCK_TIMESTAMP = datetime.now().isoformat()
+
 MOCK_SLACK_MESSAGES = [
     {
         'from': 'Alice Chen',
         'channel': 'engineering',
         'type': 'channel',
         'text': 'The staging environment is down. Can someone investigate? @here',
-        'timestamp': datetime.now().isoformat()
+        'timestamp': _MOCK_TIMESTAMP
     },
     {
         'from': 'Bob Smith',
         'channel': 'DM',
         'type': 'dm',
         'text': 'Hey! Quick question about the database schema. Do we need to add an index on the user_id column?',
-        'timestamp': datetime.now().isoformat()
+        'timestamp': _MOCK_TIMESTAMP
     },
     {
         'from': 'Carol Johnson',
         'channel': 'product',
         'type': 'mention',
         'text': '@you Can you join the product sync meeting tomorrow at 2pm? We need your input on the API design.',
-        'timestamp': datetime.now().isoformat()
+        'timestamp': _MOCK_TIMESTAMP
     },
     {
         'from': 'David Lee',
         'channel': 'DM',
         'type': 'dm',
         'text': 'The client is asking about the timeline for feature X. Can you provide an estimate by end of day?',
-        'timestamp': datetime.now().isoformat()
+        'timestamp': _MOCK_TIMESTAMP
     },
     {
         'from': 'Eve Wilson',
         'channel': 'general',
         'type': 'channel',
         'text': 'Reminder: Team lunch on Friday at noon. Please RSVP in the thread.',
-        'timestamp': datetime.now().isoformat()
+        'timestamp': _MOCK_TIMESTAMP
     },
     {
         'from': 'Frank Martinez',
         'channel': 'engineering',
         'type': 'mention',
         'text': '@you I pushed a PR for review. Can you take a look when you get a chance? #2345',
-        'timestamp': datetime.now().isoformat()
+        'timestamp': _MOCK_TIMESTAMP
     }
 ]
 
@@ -6,6 +6,10 @@ Handles task extraction and prioritization from emails and Slack messages
 from typing import Dict, List
 from langchain_ollama import ChatOllama
 import json
+import re
+
+# First [...] span in an LLM response (the JSON array of tasks)
+_JSON_ARRAY_RE = re.compile(r'\[.*\]', re.DOTALL)
 
 # ============================================================================
 # Task Extractor Agent
@@ -94,8 +98,7 @@ Return ONLY the JSON array, nothing else."""
         # Try to find JSON array if not at start
         if not response_text.startswith('['):
             # Look for [ to ] pattern
-            import re
-            json_match = re.search(r'\[.*\]', response_text, re.DOTALL)
+            json_match = _JSON_ARRAY_RE.search(response_text)
             if json_match:
                 response_text = json_match.group(0)
             else:
@@ -209,8 +212,7 @@ Return ONLY the JSON array, nothing else."""
         
         # Try to find JSON array if not at start
         if not response_text.startswith('['):
-            import re
-            json_match = re.search(r'\[.*\]', response_text, re.DOTALL)
+            json_match = _JSON_ARRAY_RE.search(response_text)
             if json_match:
                 response_text = json_match.group(0)
             else:
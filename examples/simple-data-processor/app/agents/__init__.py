@@ -6,6 +6,7 @@ from app.agents.processor_agents import (
     data_extractor,
     data_transformer,
     data_loader,
+    stream_processor,
     report_generator
 )
 
@@ -13,6 +14,7 @@ __all__ = [
     'data_extractor',
     'data_transformer',
     'data_loader',
+    'stream_processor',
     'report_generator'
 ]
 
@@ -2,23 +2,20 @@
 Application Configuration
 """
 
+from dataclasses import asdict
 from typing import Dict, Any
 
+from app.state import DataProcessorState
+
 
 def get_initial_state() -> Dict[str, Any]:
     """
     Return initial state for data processor workflow
+    
+    Field defaults are defined once on DataProcessorState; the CLI and
+    framework take the initial state as a plain dict.
     """
-    return {
-        'source_file': 'input_data.json',
-        'output_file': 'output_data.json',
-        'raw_data': [],
-        'transformed_data': [],
-        'load_status': '',
-        'report': '',
-        'records_processed': 0,
-        'errors': []
-    }
+    return asdict(DataProcessorState())
 
 
 def get_app_config() -> Dict[str, Any]:
@@ -30,4 +27,3 @@ def get_app_config() -> Dict[str, Any]:
         'version': '1.0.0',
         'description': 'Simple ETL workflow demonstrating framework usage'
     }
-
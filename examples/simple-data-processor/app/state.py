@@ -0,0 +1,35 @@
+"""
+Data Processor State
+Slotted state type shared by the workflow and agents
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+
+@dataclass(slots=True)
+class DataProcessorState:
+    """
+    State for data processing workflow
+    
+    Agents read and update fields as attributes; LangGraph snapshots the
+    fields into checkpoints, so every field needs a default.
+    """
+    
+    # Configuration
+    source_file: str = 'input_data.json'
+    output_file: str = 'output_data.json'
+    streaming: bool = False
+    stream_output_file: str = 'output_data.ndjson'  # NDJSON, used when streaming
+    
+    # Processing stages
+    raw_data: List[Dict[str, Any]] = field(default_factory=list)
+    transformed_data: List[Dict[str, Any]] = field(default_factory=list)
+    load_status: str = ''
+    
+    # Results
+    report: str = ''
+    records_processed: int = 0
+    
+    # Error tracking
+    errors: List[str] = field(default_factory=list)
@@ -3,41 +3,28 @@ Simple Data Processor Workflow
 Demonstrates a basic ETL (Extract, Transform, Load) pattern
 """
 
-from typing import TypedDict, List, Dict, Any
 from langgraph.graph import START, END
 from framework import ObservableStateGraph
 
+from app.state import DataProcessorState
+
 # Import agents
 from app.agents.processor_agents import (
     data_extractor,
     data_transformer,
     data_loader,
+    stream_processor,
     report_generator
 )
 
 
 # ============================================================================
-# State Definition
+# Routing
 # ============================================================================
 
-class DataProcessorState(TypedDict):
-    """State for data processing workflow"""
-    
-    # Configuration
-    source_file: str
-    output_file: str
-    
-    # Processing stages
-    raw_data: List[Dict[str, Any]]
-    transformed_data: List[Dict[str, Any]]
-    load_status: str
-    
-    # Results
-    report: str
-    records_processed: int
-    
-    # Error tracking
-    errors: List[str]
+def route_entry(state: DataProcessorState) -> str:
+    """Use the fused single-pass path when streaming is requested"""
+    return "stream" if state.streaming else "extract"
 
 
 # ============================================================================
@@ -54,6 +41,9 @@ def build_workflow():
     3. Load - Write to destination
     4. Report - Generate processing report
     
+    With streaming enabled, steps 1-3 are fused into a single Stream node
+    that writes NDJSON as it goes.
+    
     Returns:
         Uncompiled workflow (framework adds checkpointer)
     """
@@ -65,13 +55,24 @@ def build_workflow():
     workflow.add_node("extract", data_extractor)
     workflow.add_node("transform", data_transformer)
     workflow.add_node("load", data_loader)
+    workflow.add_node("stream", stream_processor)
     workflow.add_node("report", report_generator)
     
+    # Pick batch or streaming path
+    workflow.add_conditional_edges(
+        START,
+        route_entry,
+        {
+            "extract": "extract",
+            "stream": "stream"
+        }
+    )
+    
     # Define linear flow
-    workflow.add_edge(START, "extract")
     workflow.add_edge("extract", "transform")
     workflow.add_edge("transform", "load")
     workflow.add_edge("load", "report")
+    workflow.add_edge("stream", "report")
     workflow.add_edge("report", END)
     
     # Return uncompiled (framework adds checkpointer)
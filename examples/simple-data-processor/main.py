@@ -36,7 +36,12 @@ if __name__ == "__main__":
     cli.add_argument(
         '--output',
         type=str,
-        help='Output file path (default: output_data.json)'
+        help='Output file path (default: output_data.json, or output_data.ndjson with --stream)'
+    )
+    cli.add_argument(
+        '--stream',
+        action='store_true',
+        help='Extract, transform and load in a single pass (writes NDJSON)'
     )
     
     # Custom initial state provider that uses CLI args
@@ -44,8 +49,10 @@ if __name__ == "__main__":
         state = get_initial_state()
         if args.input:
             state['source_file'] = args.input
+        if args.stream:
+            state['streaming'] = True
         if args.output:
-            state['output_file'] = args.output
+            state['stream_output_file' if args.stream else 'output_file'] = args.output
         return state
     
     cli.add_initial_state_provider(initial_state_provider)
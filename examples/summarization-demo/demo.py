@@ -13,16 +13,50 @@ import os
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.insert(0, project_root)
 
-from framework import MemoryManager
+from framework import MemoryManager, LangChainMessageCache
 from langchain_ollama import ChatOllama
 
 
+# Static banners, built once and written with a single print() each
+_RULE = "=" * 80
+
+_BASIC_BANNER = f"""{_RULE}
+🧠 SUMMARIZATION-BASED MEMORY PRUNING DEMO
+{_RULE}
+"""
+
+_FINAL_STATE_BANNER = f"""{_RULE}
+FINAL MEMORY STATE
+{_RULE}
+"""
+
+_BASIC_FOOTER = f"""
+{_RULE}
+✅ Demo complete!
+
+Notice:
+  • Old messages were summarized (not discarded)
+  • Memory stayed within limit (10 messages)
+  • Context from early turns is preserved in summaries
+{_RULE}"""
+
+_INTERACTIVE_BANNER = f"""{_RULE}
+🧠 INTERACTIVE SUMMARIZATION DEMO
+{_RULE}
+
+This demo lets you chat and see summarization in action.
+Type 'quit' to exit, 'status' to see memory state.
+"""
+
+_INTERACTIVE_FOOTER = f"""
+{_RULE}
+✅ Interactive demo complete!
+{_RULE}"""
+
+
 def demo_basic():
     """Basic demonstration of summarization"""
-    print("=" * 80)
-    print("🧠 SUMMARIZATION-BASED MEMORY PRUNING DEMO")
-    print("=" * 80)
-    print()
+    print(_BASIC_BANNER)
     
     # Initialize state with summarization
     state = {}
@@ -63,50 +97,31 @@ def demo_basic():
         
         # Check memory status
         history_len = MemoryManager.get_conversation_length(state)
-        has_summary = any(msg['role'] == 'summary' for msg in state['conversation_history'])
+        summary = MemoryManager.get_summary(state)
         
         print(f"  📊 Memory: {history_len} messages", end="")
-        if has_summary:
+        if summary:
             print(" (includes summary) 🧠")
             # Show summary content
-            for msg in state['conversation_history']:
-                if msg['role'] == 'summary':
-                    summary_preview = msg['content'][:100] + "..." if len(msg['content']) > 100 else msg['content']
-                    print(f"     Summary: \"{summary_preview}\"")
+            summary_preview = summary['content'][:100] + "..." if len(summary['content']) > 100 else summary['content']
+            print(f"     Summary: \"{summary_preview}\"")
         else:
             print()
         print()
     
-    print("=" * 80)
-    print("FINAL MEMORY STATE")
-    print("=" * 80)
-    print()
+    print(_FINAL_STATE_BANNER)
     
     for i, msg in enumerate(state['conversation_history'], 1):
         role = msg['role'].upper()
         content = msg['content'][:80] + "..." if len(msg['content']) > 80 else msg['content']
         print(f"{i}. [{role}] {content}")
     
-    print()
-    print("=" * 80)
-    print("✅ Demo complete!")
-    print()
-    print("Notice:")
-    print("  • Old messages were summarized (not discarded)")
-    print("  • Memory stayed within limit (10 messages)")
-    print("  • Context from early turns is preserved in summaries")
-    print("=" * 80)
+    print(_BASIC_FOOTER)
 
 
 def demo_interactive():
     """Interactive demonstration"""
-    print("=" * 80)
-    print("🧠 INTERACTIVE SUMMARIZATION DEMO")
-    print("=" * 80)
-    print()
-    print("This demo lets you chat and see summarization in action.")
-    print("Type 'quit' to exit, 'status' to see memory state.")
-    print()
+    print(_INTERACTIVE_BANNER)
     
     # Initialize
     state = {}
@@ -119,6 +134,7 @@ def demo_interactive():
     )
     
     llm = ChatOllama(model="llama3.2", temperature=0.7)
+    lc_cache = LangChainMessageCache()
     
     print(f"✓ Memory initialized (max: 8 messages)")
     print()
@@ -136,20 +152,18 @@ def demo_interactive():
             print()
             print("  📊 MEMORY STATUS:")
             print(f"     Total messages: {MemoryManager.get_conversation_length(state)}")
-            has_summary = any(msg['role'] == 'summary' for msg in state['conversation_history'])
-            print(f"     Has summary: {'Yes 🧠' if has_summary else 'No'}")
-            if has_summary:
-                for msg in state['conversation_history']:
-                    if msg['role'] == 'summary':
-                        print(f"     Summary: \"{msg['content'][:100]}...\"")
+            summary = MemoryManager.get_summary(state)
+            print(f"     Has summary: {'Yes 🧠' if summary else 'No'}")
+            if summary:
+                print(f"     Summary: \"{summary['content'][:100]}...\"")
             print()
             continue
         
         # Add user message and get response
         MemoryManager.add_user_message(state, user_input)
         
-        # Generate response
-        messages = MemoryManager.get_langchain_messages(state)
+        # Generate response (only converts messages added since last turn)
+        messages = lc_cache.convert(MemoryManager.get_conversation_history(state))
         response = llm.invoke(messages)
         
         print(f"🤖 Assistant: {response.content}")
@@ -159,18 +173,14 @@ def demo_interactive():
         
         # Show memory status
         history_len = MemoryManager.get_conversation_length(state)
-        has_summary = any(msg['role'] == 'summary' for msg in state['conversation_history'])
         print(f"  📊 Memory: {history_len} messages", end="")
-        if has_summary:
+        if MemoryManager.get_summary(state):
             print(" (includes summary) 🧠")
         else:
             print()
         print()
     
-    print()
-    print("=" * 80)
-    print("✅ Interactive demo complete!")
-    print("=" * 80)
+    print(_INTERACTIVE_FOOTER)
 
 
 if __name__ == "__main__":
@@ -1,56 +1,74 @@
 """
 Framework Module
-Provides cross-cutting concerns like OpenTelemetry instrumentation, durable executions, 
+Provides cross-cutting concerns like OpenTelemetry instrumentation, durable executions,
 MCP integration, and conversation memory management
+
+Public names are resolved lazily (PEP 562): a submodule is only imported the
+first time one of its names is accessed, so e.g. `from framework import
+MemoryManager` does not pull in OpenTelemetry or psycopg.
 """
 
-from framework.observability import (
-    init_observability,
-    ObservableStateGraph,
-    create_workflow_span,
-    instrument_agent,
-    get_metrics,
-    log_event,
-    log_state_transition
-)
+import importlib
+from typing import Any, List
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {
+    # Observability
+    'init_observability': 'framework.observability',
+    'ObservableStateGraph': 'framework.observability',
+    'create_workflow_span': 'framework.observability',
+    'instrument_agent': 'framework.observability',
+    'get_metrics': 'framework.observability',
+    'log_event': 'framework.observability',
+    'log_state_transition': 'framework.observability',
+    # Durability
+    'init_durability': 'framework.durability',
+    'get_durability_manager': 'framework.durability',
+    # MCP Integration
+    'init_mcp_client': 'framework.mcp_client',
+    'shutdown_mcp_client': 'framework.mcp_client',
+    'release_mcp_client': 'framework.mcp_client',
+    'get_mcp_manager': 'framework.mcp_client',
+    'run_async_tool_call': 'framework.mcp_client',
+    'run_on_mcp_loop': 'framework.mcp_client',
+    'MCPClient': 'framework.mcp_client',
+    'MCPManager': 'framework.mcp_client',
+    'MCPServerConfig': 'framework.mcp_client',
+    # Memory Management
+    'add_messages': 'framework.memory',
+    'create_memory_aware_reducer': 'framework.memory',
+    'to_langchain_messages': 'framework.memory',
+    'ConversationMemoryMixin': 'framework.memory',
+    'MemoryManager': 'framework.memory',
+    'MemoryProfile': 'framework.memory',
+    'MemoryInspector': 'framework.memory',
+    'LangChainMessageCache': 'framework.memory',
+    'MemoryConfig': 'framework.memory',
+    'with_conversation_memory': 'framework.memory',
+    'requires_conversation_memory': 'framework.memory',
+    # Interactive Commands
+    'InteractiveCommandHandler': 'framework.interactive',
+    'interactive_command': 'framework.interactive',
+    # CLI
+    'FrameworkCLI': 'framework.cli',
+    'run_framework_app': 'framework.cli',
+}
+
 
-from framework.durability import (
-    init_durability,
-    get_durability_manager
-)
+def __getattr__(name: str) -> Any:
+    """Import the owning submodule on first access and cache the attribute"""
+    module_path = _LAZY_ATTRS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
-from framework.mcp_client import (
-    init_mcp_client,
-    shutdown_mcp_client,
-    get_mcp_manager,
-    run_async_tool_call,
-    MCPClient,
-    MCPManager,
-    MCPServerConfig
-)
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
 
-from framework.memory import (
-    add_messages,
-    create_memory_aware_reducer,
-    to_langchain_messages,
-    ConversationMemoryMixin,
-    MemoryManager,
-    MemoryProfile,
-    MemoryInspector,
-    MemoryConfig,
-    with_conversation_memory,
-    requires_conversation_memory
-)
 
-from framework.interactive import (
-    InteractiveCommandHandler,
-    interactive_command
-)
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
-from framework.cli import (
-    FrameworkCLI,
-    run_framework_app
-)
 
 __all__ = [
     # Observability
@@ -67,8 +85,10 @@ __all__ = [
     # MCP Integration
     'init_mcp_client',
     'shutdown_mcp_client',
+    'release_mcp_client',
     'get_mcp_manager',
     'run_async_tool_call',
+    'run_on_mcp_loop',
     'MCPClient',
     'MCPManager',
     'MCPServerConfig',
@@ -80,6 +100,7 @@ __all__ = [
     'MemoryManager',
     'MemoryProfile',
     'MemoryInspector',
+    'LangChainMessageCache',
     'MemoryConfig',
     'with_conversation_memory',
     'requires_conversation_memory',
@@ -90,4 +111,3 @@ __all__ = [
     'FrameworkCLI',
     'run_framework_app',
 ]
-
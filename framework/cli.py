@@ -6,10 +6,33 @@ Provides a standard CLI interface for framework applications
 import argparse
 import sys
 import os
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, List, Tuple
 from framework.loader import load_and_run_app
 
 
+# Horizontal rule used by the banner and session summary
+_SEPARATOR = "=" * 70
+
+# List fields counted in the session summary, with their display labels
+_SUMMARY_FIELDS = (
+    ('emails', 'Emails'),
+    ('slack_messages', 'Slack Messages'),
+    ('raw_data', 'Raw Data'),
+    ('transformed_data', 'Transformed Data'),
+)
+
+# Standard flags understood by the fast argument path: flag -> (dest, takes_value)
+_STANDARD_FLAGS = {
+    '--mock': ('mock', False),
+    '--debug': ('debug', False),
+    '--resume': ('resume', False),
+    '--config-dir': ('config_dir', True),
+}
+
+# Project root (parent of framework/), resolved once at import
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
 class FrameworkCLI:
     """
     Standard CLI builder for framework applications
@@ -65,45 +88,82 @@ class FrameworkCLI:
         self.show_banner = show_banner
         self.show_summary = show_summary
         
-        # Setup argument parser
-        self.parser = argparse.ArgumentParser(
-            description=description,
-            formatter_class=argparse.RawDescriptionHelpFormatter
-        )
-        
-        # Add standard arguments
-        self._add_standard_arguments()
+        # Argument parser is built on first use (see parser property);
+        # custom arguments registered before then are queued here
+        self._parser: Optional[argparse.ArgumentParser] = None
+        self._pending_args: List[Tuple[tuple, dict]] = []
         
         # Custom initial state provider
         self._initial_state_provider: Optional[Callable] = None
     
-    def _add_standard_arguments(self):
+    @property
+    def parser(self) -> argparse.ArgumentParser:
+        """Argument parser, built with standard and custom arguments on first access"""
+        if self._parser is None:
+            self._parser = argparse.ArgumentParser(
+                description=self.description,
+                formatter_class=argparse.RawDescriptionHelpFormatter
+            )
+            self._add_standard_arguments(self._parser)
+            for args, kwargs in self._pending_args:
+                self._parser.add_argument(*args, **kwargs)
+            self._pending_args.clear()
+        return self._parser
+    
+    def _add_standard_arguments(self, parser: argparse.ArgumentParser):
         """Add standard framework arguments"""
-        self.parser.add_argument(
+        parser.add_argument(
             '--mock',
             action='store_true',
             help='Use mock MCP servers (no real API calls)'
         )
         
-        self.parser.add_argument(
+        parser.add_argument(
             '--debug',
             action='store_true',
             help='Enable debug output'
         )
         
-        self.parser.add_argument(
+        parser.add_argument(
             '--config-dir',
             type=str,
             default='config',
             help='Configuration directory (default: config)'
         )
         
-        self.parser.add_argument(
+        parser.add_argument(
             '--resume',
             action='store_true',
             help='Resume interrupted workflows if available'
         )
     
+    def _fast_parse(self, argv: List[str]) -> Optional[argparse.Namespace]:
+        """
+        Parse argv without building the argparse parser
+        
+        Only handles exact standard flags (no custom arguments registered).
+        Returns None for anything else (-h, typos, abbreviations, --flag=value)
+        so argparse can produce its usual help and error output.
+        """
+        if self._pending_args or self._parser is not None:
+            return None
+        
+        values = {'mock': False, 'debug': False, 'resume': False, 'config_dir': 'config'}
+        tokens = iter(argv)
+        for token in tokens:
+            spec = _STANDARD_FLAGS.get(token)
+            if spec is None:
+                return None
+            dest, takes_value = spec
+            if takes_value:
+                value = next(tokens, None)
+                if value is None or value.startswith('-'):
+                    return None
+                values[dest] = value
+            else:
+                values[dest] = True
+        return argparse.Namespace(**values)
+    
     def add_argument(self, *args, **kwargs):
         """
         Add custom argument to parser
@@ -111,7 +171,10 @@ class FrameworkCLI:
         Example:
             cli.add_argument('--my-arg', help='My custom argument')
         """
-        self.parser.add_argument(*args, **kwargs)
+        if self._parser is None:
+            self._pending_args.append((args, kwargs))
+        else:
+            self._parser.add_argument(*args, **kwargs)
         return self
     
     def add_initial_state_provider(self, provider: Callable):
@@ -135,31 +198,31 @@ class FrameworkCLI:
     
     def _setup_paths(self):
         """Setup Python paths for framework imports"""
-        # Add project root to path
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        if project_root not in sys.path:
-            sys.path.insert(0, project_root)
+        # Add project root to path (after the first run it is normally
+        # still at sys.path[0], which skips the full list scan)
+        if sys.path[:1] != [_PROJECT_ROOT] and _PROJECT_ROOT not in sys.path:
+            sys.path.insert(0, _PROJECT_ROOT)
     
     def _print_banner(self, args):
         """Print startup banner"""
         if not self.show_banner:
             return
         
-        print("\n" + "=" * 70)
-        print(f"💬 {self.title.upper()}")
-        print("=" * 70)
-        print(f"\n{self.description}")
+        lines = ["", _SEPARATOR, f"💬 {self.title.upper()}", _SEPARATOR, f"\n{self.description}"]
         
         # Show mode
         if args.mock:
-            print("\n🎭 Mode: MOCK (no real API calls)")
+            lines.append("\n🎭 Mode: MOCK (no real API calls)")
         else:
-            print("\n🔌 Mode: PRODUCTION (real data)")
+            lines.append("\n🔌 Mode: PRODUCTION (real data)")
         
         if args.debug:
-            print("🐛 Debug: ENABLED")
+            lines.append("🐛 Debug: ENABLED")
         
-        print("\n" + "=" * 70 + "\n")
+        lines.append("\n" + _SEPARATOR + "\n")
+        
+        # Single write for the whole block
+        print("\n".join(lines))
     
     def _get_initial_state(self, args) -> Dict[str, Any]:
         """Get initial state from provider or defaults"""
@@ -178,35 +241,36 @@ class FrameworkCLI:
         if not self.show_summary:
             return
         
-        print("\n" + "=" * 70)
-        print("📊 SESSION SUMMARY")
-        print("=" * 70)
+        lines = ["", _SEPARATOR, "📊 SESSION SUMMARY", _SEPARATOR]
         
         # Common summary fields
         if 'turn_count' in result:
-            print(f"Turns: {result['turn_count']}")
+            lines.append(f"Turns: {result['turn_count']}")
         
         if 'records_processed' in result:
-            print(f"Records processed: {result['records_processed']}")
+            lines.append(f"Records processed: {result['records_processed']}")
         
         # Show data counts if available
-        data_fields = ['emails', 'slack_messages', 'raw_data', 'transformed_data']
-        for field in data_fields:
-            if field in result and isinstance(result[field], list):
-                print(f"{field.replace('_', ' ').title()}: {len(result[field])}")
+        for field, label in _SUMMARY_FIELDS:
+            value = result.get(field)
+            if isinstance(value, list):
+                lines.append(f"{label}: {len(value)}")
         
         # Show errors if any
-        if result.get('errors'):
-            print(f"\n⚠️  Errors: {len(result['errors'])}")
-            for error in result['errors'][:5]:  # Show first 5
-                print(f"  • {error}")
-            if len(result['errors']) > 5:
-                print(f"  ... and {len(result['errors']) - 5} more")
+        errors = result.get('errors')
+        if errors:
+            lines.append(f"\n⚠️  Errors: {len(errors)}")
+            lines.extend(f"  • {error}" for error in errors[:5])  # Show first 5
+            if len(errors) > 5:
+                lines.append(f"  ... and {len(errors) - 5} more")
         else:
-            print("\n✅ No errors")
+            lines.append("\n✅ No errors")
+        
+        lines.append("\n✅ Session completed successfully!")
+        lines.append(_SEPARATOR + "\n")
         
-        print("\n✅ Session completed successfully!")
-        print("=" * 70 + "\n")
+        # Single write for the whole block
+        print("\n".join(lines))
     
     def run(self) -> int:
         """
@@ -218,8 +282,8 @@ class FrameworkCLI:
         # Setup paths
         self._setup_paths()
         
-        # Parse arguments
-        args = self.parser.parse_args()
+        # Parse arguments (fast path for standard flags, argparse otherwise)
+        args = self._fast_parse(sys.argv[1:]) or self.parser.parse_args()
         
         # Print banner
         self._print_banner(args)
@@ -249,11 +313,15 @@ class FrameworkCLI:
             return 130  # Standard exit code for Ctrl+C
         
         except Exception as e:
-            print(f"\n❌ Error: {e}")
-            if args.debug:
-                import traceback
-                traceback.print_exc()
-            return 1
+            return self._handle_run_error(e, args.debug)
+    
+    def _handle_run_error(self, error: Exception, debug: bool) -> int:
+        """Report a workflow failure; traceback is only imported when debugging"""
+        print(f"\n❌ Error: {error}")
+        if debug:
+            import traceback
+            traceback.print_exc()
+        return 1
 
 
 # Convenience function for simple cases
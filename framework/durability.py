@@ -1,36 +1,76 @@
 """
 Durability Module
 Provides PostgreSQL-backed checkpointing for durable workflow executions
+
+Performance character:
+    This module is I/O-bound (network round trips, file reads, syscalls),
+    not compute-bound. The hot paths are:
+    - init_checkpointer: connection + schema check round trips
+      -> lazy imports, connection pool, skip setup() when schema is current
+    - find_interrupted_workflows: one database query
+      -> single anti-join query, LIMIT/OFFSET, driver-built rows
+    - load_config: file stat/read + YAML parse
+      -> cached by file mtime
+    - generate_thread_id: clock formatting + urandom read
+      -> timestamp cached per second, optional counter suffix
+    Improvements here should reduce round trips, syscalls, or imports;
+    vectorized or parallel compute techniques do not apply.
 """
 
+import itertools
 import os
+import re
+import time
 import yaml
-import uuid
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
-from langgraph.checkpoint.postgres import PostgresSaver
-import psycopg
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, TYPE_CHECKING
+
+# psycopg and the Postgres checkpointer are imported in init_checkpointer(),
+# so processes running with durability disabled never load them
+if TYPE_CHECKING:
+    from langgraph.checkpoint.postgres import PostgresSaver
 
 
+# Database name in key-value ("dbname=x") or URL (".../x?opts") connection strings
+_DBNAME_RE = re.compile(r'(?:^|\s)dbname=(\S+)|/([^/?\s]+)(?:\?|$)')
+
 # Global configuration
 _config = None
-_durability_manager = None
-_initialized = False
+_durability_manager = None  # Set once init_durability() has run
+
+# Connection strings whose checkpoint schema is known to be up to date
+_schema_ready: set = set()
+
+# Thread ID suffix counter and (epoch second, formatted timestamp) cache
+_thread_counter = itertools.count()
+_timestamp_cache = (None, '')
 
 
 # ============================================================================
 # Configuration Loading
 # ============================================================================
 
-def load_config() -> Dict[str, Any]:
-    """Load durability configuration from YAML file"""
-    config_path = os.path.join(
+def _config_path() -> str:
+    """Path of the durability configuration file"""
+    return os.path.join(
         os.path.dirname(os.path.dirname(__file__)), 
         'config', 
         'durability_config.yaml'
     )
-    
-    if os.path.exists(config_path):
+
+
+def _config_mtime(config_path: str) -> Optional[float]:
+    """Modification time of the config file, or None if it doesn't exist"""
+    try:
+        return os.stat(config_path).st_mtime
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=4)
+def _load_config_cached(config_path: str, mtime: Optional[float]) -> Dict[str, Any]:
+    """Parse the config file; keyed on mtime so edits are picked up"""
+    if mtime is not None:
         with open(config_path, 'r') as f:
             return yaml.safe_load(f)
     
@@ -50,6 +90,32 @@ def load_config() -> Dict[str, Any]:
     }
 
 
+def load_config() -> Dict[str, Any]:
+    """
+    Load durability configuration from YAML file
+    
+    The parsed file is cached until its mtime changes, so the returned
+    dict is shared between callers and must be treated as read-only.
+    """
+    config_path = _config_path()
+    return _load_config_cached(config_path, _config_mtime(config_path))
+
+
+# ============================================================================
+# Thread ID Helpers
+# ============================================================================
+
+def _timestamp_str() -> str:
+    """Local time as YYYYMMDD-HHMMSS, formatted at most once per second"""
+    global _timestamp_cache
+    now = int(time.time())
+    cached_second, formatted = _timestamp_cache
+    if now != cached_second:
+        formatted = time.strftime('%Y%m%d-%H%M%S', time.localtime(now))
+        _timestamp_cache = (now, formatted)
+    return formatted
+
+
 # ============================================================================
 # Durability Manager
 # ============================================================================
@@ -74,9 +140,10 @@ class DurabilityManager:
         """
         self.config = config
         self.checkpointer = None
-        self.connection = None
+        self.pool = None
+        self._conn_str: Optional[str] = None  # Built on first use
         
-    def init_checkpointer(self) -> Optional[PostgresSaver]:
+    def init_checkpointer(self) -> Optional["PostgresSaver"]:
         """
         Initialize PostgreSQL checkpointer using LangGraph's PostgresSaver
         
@@ -88,21 +155,39 @@ class DurabilityManager:
             return None
         
         try:
+            from psycopg_pool import ConnectionPool
+            from langgraph.checkpoint.postgres import PostgresSaver
+            
             # Build PostgreSQL connection string
             conn_str = self._build_connection_string()
             
-            # Create PostgreSQL connection
-            self.connection = psycopg.connect(
+            # Create PostgreSQL connection pool; connections are borrowed per
+            # operation and replaced automatically if they go bad
+            pool_config = self.config.get('pool', {})
+            connect_timeout = pool_config.get('connect_timeout', 10)
+            self.pool = ConnectionPool(
                 conn_str,
-                autocommit=True,
-                prepare_threshold=0
+                min_size=pool_config.get('min_size', 1),
+                max_size=pool_config.get('max_size', 4),
+                kwargs={
+                    'autocommit': True,
+                    'prepare_threshold': 0,
+                    'connect_timeout': connect_timeout
+                },
+                open=True
             )
             
+            # Fail fast if the database is unreachable
+            self.pool.wait(timeout=connect_timeout)
+            
             # Initialize LangGraph PostgresSaver
-            self.checkpointer = PostgresSaver(self.connection)
+            self.checkpointer = PostgresSaver(self.pool)
             
-            # Setup schema (creates tables if not exist)
-            self.checkpointer.setup()
+            # Setup schema (creates tables if not exist) unless already current
+            if conn_str not in _schema_ready:
+                if not self._schema_is_current(len(PostgresSaver.MIGRATIONS) - 1):
+                    self.checkpointer.setup()
+                _schema_ready.add(conn_str)
             
             print(f"💾 Durability: Enabled (PostgreSQL)")
             print(f"   Database: {self._get_database_name(conn_str)}")
@@ -111,41 +196,70 @@ class DurabilityManager:
             return self.checkpointer
             
         except Exception as e:
+            self.cleanup()
+            self.pool = None
+            self.checkpointer = None
             print(f"⚠️  Durability: Failed to initialize PostgreSQL checkpointer: {e}")
             print(f"   Continuing without durable executions")
             return None
     
+    def _schema_is_current(self, latest_version: int) -> bool:
+        """
+        Check whether PostgresSaver's migrations have all been applied
+        
+        One SELECT against checkpoint_migrations, instead of the DDL that
+        setup() issues on every start.
+        
+        Args:
+            latest_version: Index of the newest PostgresSaver migration
+            
+        Returns:
+            True if the schema is at latest_version, False otherwise
+        """
+        try:
+            with self.pool.connection() as conn, conn.cursor() as cur:
+                cur.execute("SELECT MAX(v) FROM checkpoint_migrations")
+                row = cur.fetchone()
+        except Exception:
+            # Table missing (fresh database) - let setup() create it
+            return False
+        return bool(row) and row[0] is not None and row[0] >= latest_version
+    
     def _build_connection_string(self) -> str:
         """
         Build PostgreSQL connection string from config
         
+        Built once per manager; the config does not change after construction.
+        
         Returns:
             Connection string for psycopg
         """
+        if self._conn_str is not None:
+            return self._conn_str
+        
         # Option 1: Use explicit connection string
         if 'connection_string' in self.config:
-            return self.config['connection_string']
+            self._conn_str = self.config['connection_string']
+            return self._conn_str
         
         # Option 2: Build from components
         pg_config = self.config.get('postgres', {})
-        return (
+        self._conn_str = (
             f"host={pg_config.get('host', 'localhost')} "
             f"port={pg_config.get('port', 5432)} "
             f"dbname={pg_config.get('database', 'langgraph')} "
             f"user={pg_config.get('user', 'postgres')} "
             f"password={pg_config.get('password', '')}"
         )
+        return self._conn_str
     
-    def _get_database_name(self, conn_str: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _get_database_name(conn_str: str) -> str:
         """Extract database name from connection string for display"""
-        if '/' in conn_str:
-            # Extract from URL format
-            return conn_str.split('/')[-1].split('?')[0]
-        elif 'dbname=' in conn_str:
-            # Extract from key-value format
-            for part in conn_str.split():
-                if part.startswith('dbname='):
-                    return part.split('=')[1]
+        match = _DBNAME_RE.search(conn_str)
+        if match:
+            return match.group(1) or match.group(2)
         return 'unknown'
     
     def generate_thread_id(self, service_name: Optional[str] = None) -> str:
@@ -159,62 +273,76 @@ class DurabilityManager:
             Unique thread ID string
         """
         parts = []
+        thread_id_config = self.config.get('thread_id', {})
         
         # Add service name
-        if self.config.get('thread_id', {}).get('include_service_name', True):
+        if thread_id_config.get('include_service_name', True):
             name = service_name or self.config.get('service_name', 'app')
             parts.append(name)
         
         # Add timestamp
-        if self.config.get('thread_id', {}).get('include_timestamp', True):
-            timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
-            parts.append(timestamp)
+        if thread_id_config.get('include_timestamp', True):
+            parts.append(_timestamp_str())
         
         # Add random suffix
-        if self.config.get('thread_id', {}).get('include_random_suffix', True):
-            random_suffix = uuid.uuid4().hex[:8]
+        if thread_id_config.get('include_random_suffix', True):
+            if thread_id_config.get('strong_uniqueness', True):
+                # 8 random hex chars
+                random_suffix = os.urandom(4).hex()
+            else:
+                # '<pid>-<counter>' in hex; the separator keeps different
+                # pid/counter pairs from concatenating to the same string
+                random_suffix = f"{os.getpid():x}-{next(_thread_counter):x}"
             parts.append(random_suffix)
         
         return '-'.join(parts)
     
-    def find_interrupted_workflows(self) -> List[Dict[str, Any]]:
+    def find_interrupted_workflows(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
         """
         Find workflows that were interrupted before completion
         
         Queries PostgreSQL for workflows that have checkpoints but never reached END state.
         Only returns workflows within the max_age_hours window.
         
+        Args:
+            limit: Maximum number of workflows to return (None = all)
+            offset: Number of workflows to skip, for paging through results
+        
         Returns:
             List of dicts with thread_id and last_checkpoint info
         """
-        if not self.checkpointer or not self.connection:
+        if not self.checkpointer or not self.pool:
             return []
         
         try:
+            from psycopg.rows import dict_row
+            
             # Query for threads that have checkpoints but no END node
             # Note: PostgreSQL checkpoint tables don't have a timestamp column by default
             # We query all interrupted workflows regardless of age
-            with self.connection.cursor() as cur:
+            # NOT EXISTS is a per-thread probe on the (thread_id, checkpoint_ns, ...)
+            # primary key instead of materializing a NOT IN list of ended threads
+            # dict_row builds each result dict in the driver, keyed by column alias
+            with self.pool.connection() as conn, conn.cursor(row_factory=dict_row) as cur:
                 cur.execute("""
-                    SELECT DISTINCT thread_id, MAX(checkpoint_id) as last_checkpoint_id
-                    FROM checkpoints
-                    GROUP BY thread_id
-                    HAVING thread_id NOT IN (
-                        SELECT DISTINCT thread_id 
-                        FROM checkpoints 
-                        WHERE checkpoint_ns LIKE '%%__end__'
+                    SELECT c.thread_id, MAX(c.checkpoint_id) AS last_checkpoint_id
+                    FROM checkpoints c
+                    WHERE NOT EXISTS (
+                        SELECT 1
+                        FROM checkpoints e
+                        WHERE e.thread_id = c.thread_id
+                          AND e.checkpoint_ns LIKE '%%__end__'
                     )
-                    ORDER BY MAX(checkpoint_id) DESC
-                """)
-                
-                interrupted = []
-                for row in cur.fetchall():
-                    interrupted.append({
-                        'thread_id': row[0],
-                        'last_checkpoint_id': row[1]
-                    })
+                    GROUP BY c.thread_id
+                    ORDER BY last_checkpoint_id DESC
+                    LIMIT %s OFFSET %s
+                """, (limit, offset))
                 
-                return interrupted
+                return cur.fetchall()
                 
         except Exception as e:
             print(f"⚠️  Error finding interrupted workflows: {e}")
@@ -249,11 +377,46 @@ class DurabilityManager:
             print(f"  ✗ Failed to resume workflow {thread_id}: {e}")
             return None
     
+    def resume_workflows(
+        self,
+        workflow,
+        interrupted_workflows: List[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Resume a batch of interrupted workflows
+        
+        Runs serially by default. Setting resume.max_parallel > 1 resumes
+        on a thread pool so database round trips overlap; only enable it
+        for workflows that don't prompt for input or share non-thread-safe
+        clients, since resumed runs would then execute concurrently.
+        
+        Args:
+            workflow: Compiled LangGraph workflow
+            interrupted_workflows: Rows from find_interrupted_workflows()
+            
+        Returns:
+            Result of resume_workflow() for each workflow, in input order
+        """
+        def resume(interrupted: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            thread_id = interrupted['thread_id']
+            config = {"configurable": {"thread_id": thread_id}}
+            return self.resume_workflow(workflow, thread_id, config)
+        
+        max_parallel = self.config.get('resume', {}).get('max_parallel', 1)
+        if max_parallel <= 1 or len(interrupted_workflows) <= 1:
+            return [resume(interrupted) for interrupted in interrupted_workflows]
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        workers = min(max_parallel, len(interrupted_workflows))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(resume, interrupted_workflows))
+    
     def cleanup(self):
-        """Clean up resources (close DB connection)"""
-        if self.connection:
+        """Clean up resources (close DB connection pool)"""
+        if self.pool:
             try:
-                self.connection.close()
+                self.pool.close()
             except Exception:
                 pass
 
@@ -269,19 +432,21 @@ def init_durability() -> Optional[DurabilityManager]:
     Returns:
         DurabilityManager instance if enabled, None otherwise
     """
-    global _config, _durability_manager, _initialized
+    global _config, _durability_manager
     
-    if _initialized:
-        return _durability_manager
+    # Fast path: a single global read once initialized
+    manager = _durability_manager
+    if manager is not None:
+        return manager
     
     _config = load_config()
-    _durability_manager = DurabilityManager(_config)
+    manager = DurabilityManager(_config)
     
     # Initialize checkpointer
-    _durability_manager.init_checkpointer()
+    manager.init_checkpointer()
     
-    _initialized = True
-    return _durability_manager
+    _durability_manager = manager
+    return manager
 
 
 def get_durability_manager() -> Optional[DurabilityManager]:
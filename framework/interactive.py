@@ -30,11 +30,28 @@ class InteractiveCommandHandler:
             return state
     """
     
-    # Built-in commands
-    STATUS_COMMANDS = ['status', 'stats', 'memory']
-    EXPORT_COMMANDS = ['export', 'save']
-    HELP_COMMANDS = ['help', '?', 'commands']
-    EXIT_COMMANDS = ['exit', 'quit', 'bye', 'goodbye']
+    # Built-in commands (lowercase aliases, fixed at class definition)
+    STATUS_COMMANDS = frozenset({'status', 'stats', 'memory'})
+    EXPORT_COMMANDS = frozenset({'export', 'save'})
+    HELP_COMMANDS = frozenset({'help', '?', 'commands'})
+    EXIT_COMMANDS = frozenset({'exit', 'quit', 'bye', 'goodbye'})
+    
+    # Sorted built-in aliases for list_commands()
+    _BUILTIN_COMMAND_NAMES = tuple(sorted(
+        STATUS_COMMANDS | EXPORT_COMMANDS | HELP_COMMANDS | EXIT_COMMANDS
+    ))
+    
+    # Alias -> name of the built-in runner, so handle() needs one dict lookup
+    _BUILTIN_DISPATCH: Dict[str, str] = {
+        alias: runner
+        for aliases, runner in (
+            (STATUS_COMMANDS, '_run_status'),
+            (EXPORT_COMMANDS, '_run_export'),
+            (HELP_COMMANDS, '_run_help'),
+            (EXIT_COMMANDS, '_run_exit'),
+        )
+        for alias in aliases
+    }
     
     # Custom commands registry (extensible)
     _custom_commands: Dict[str, Callable] = {}
@@ -64,25 +81,10 @@ class InteractiveCommandHandler:
             print("   (Please enter a question or command)")
             return True
         
-        # Status command
-        if command in cls.STATUS_COMMANDS:
-            cls._handle_status(state)
-            return True
-        
-        # Export command
-        if command in cls.EXPORT_COMMANDS:
-            cls._handle_export(state)
-            return True
-        
-        # Help command
-        if command in cls.HELP_COMMANDS:
-            cls._handle_help(state, custom_commands)
-            return True
-        
-        # Exit command
-        if command in cls.EXIT_COMMANDS:
-            cls._handle_exit(state)
-            state['continue_chat'] = False
+        # Built-in commands (status, export, help, exit)
+        runner = cls._BUILTIN_DISPATCH.get(command)
+        if runner is not None:
+            getattr(cls, runner)(state, custom_commands)
             return True
         
         # Custom commands
@@ -98,6 +100,25 @@ class InteractiveCommandHandler:
         # Not a command - regular query
         return False
     
+    # Built-in runners share one signature so handle() can dispatch uniformly
+    
+    @classmethod
+    def _run_status(cls, state: Dict[str, Any], custom_commands: Optional[Dict] = None):
+        cls._handle_status(state)
+    
+    @classmethod
+    def _run_export(cls, state: Dict[str, Any], custom_commands: Optional[Dict] = None):
+        cls._handle_export(state)
+    
+    @classmethod
+    def _run_help(cls, state: Dict[str, Any], custom_commands: Optional[Dict] = None):
+        cls._handle_help(state, custom_commands)
+    
+    @classmethod
+    def _run_exit(cls, state: Dict[str, Any], custom_commands: Optional[Dict] = None):
+        cls._handle_exit(state)
+        state['continue_chat'] = False
+    
     @staticmethod
     def _handle_status(state: Dict[str, Any]):
         """Handle status command"""
@@ -171,13 +192,9 @@ class InteractiveCommandHandler:
     @classmethod
     def list_commands(cls) -> List[str]:
         """Get list of all available commands"""
-        commands = []
-        commands.extend(cls.STATUS_COMMANDS)
-        commands.extend(cls.EXPORT_COMMANDS)
-        commands.extend(cls.HELP_COMMANDS)
-        commands.extend(cls.EXIT_COMMANDS)
-        commands.extend(cls._custom_commands.keys())
-        return sorted(set(commands))
+        if not cls._custom_commands:
+            return list(cls._BUILTIN_COMMAND_NAMES)
+        return sorted(cls._BUILTIN_DISPATCH.keys() | cls._custom_commands.keys())
 
 
 # Convenience decorator for custom commands
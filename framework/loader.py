@@ -3,18 +3,91 @@ Framework Application Loader
 Dynamically loads and executes application modules using importlib
 """
 
-import importlib
 import asyncio
-from typing import Dict, Any, Optional
-from framework.observability import init_observability, create_workflow_span
-from framework.durability import init_durability
-from framework.mcp_client import init_mcp_client, shutdown_mcp_client
+import importlib
+from typing import Dict, Any, Callable, Optional, Tuple
+
+# Observability (OpenTelemetry), durability and MCP are imported inside
+# load_and_run_app(), so importing this module (e.g. for get_app_config or
+# CLI --help) doesn't pull in those stacks
+
+
+# Upper bound on interrupted workflows resumed per start (limit for safety)
+_MAX_AUTO_RESUME = 5
+
+# (module path, id(checkpointer)) -> (checkpointer, compiled workflow)
+_WORKFLOW_CACHE: Dict[Tuple[str, int], Tuple[Any, Any]] = {}
+
+
+def _silent(*args, **kwargs):
+    """Stand-in for print() when loader progress output is disabled"""
+
+
+def _build_and_compile(app_module_path: str, checkpointer: Any, say: Callable = print) -> Any:
+    """Import the app module, build its workflow and compile it if needed"""
+    # Dynamically import the application module
+    try:
+        app_module = importlib.import_module(app_module_path)
+    except ImportError as e:
+        raise ImportError(f"Failed to load application module '{app_module_path}': {e}")
+    
+    # Get the build_workflow function from the app
+    build_workflow = getattr(app_module, 'build_workflow', None)
+    if build_workflow is None:
+        raise AttributeError(
+            f"Application module '{app_module_path}' must provide a 'build_workflow()' function"
+        )
+    
+    say(f"✓ Application module loaded successfully")
+    say(f"🔧 Framework: Building workflow...")
+    
+    # Build the workflow (returns either compiled workflow or graph)
+    workflow_result = build_workflow()
+    
+    # Graphs expose .compile(); compiled workflows only expose .invoke()
+    if hasattr(workflow_result, 'compile'):
+        # It's a graph - compile with checkpointer
+        if checkpointer:
+            workflow = workflow_result.compile(checkpointer=checkpointer)
+            say(f"✓ Workflow compiled with durable checkpointing")
+        else:
+            workflow = workflow_result.compile()
+            say(f"✓ Workflow compiled")
+        return workflow
+    
+    # Already compiled (has .invoke()) or unknown - use as is
+    return workflow_result
+
+
+def _get_workflow(app_module_path: str, checkpointer: Any, say: Callable = print) -> Any:
+    """
+    Return the compiled workflow for an app, building it on first use
+    
+    Keyed by module path and checkpointer identity; the checkpointer is kept
+    alongside the workflow so its id can't be reused while cached.
+    """
+    key = (app_module_path, id(checkpointer))
+    cached = _WORKFLOW_CACHE.get(key)
+    if cached is not None:
+        say(f"✓ Reusing compiled workflow for '{app_module_path}'")
+        return cached[1]
+    
+    workflow = _build_and_compile(app_module_path, checkpointer, say)
+    _WORKFLOW_CACHE[key] = (checkpointer, workflow)
+    return workflow
+
+
+def clear_workflow_cache():
+    """Drop cached compiled workflows (e.g. after reloading an app module)"""
+    _WORKFLOW_CACHE.clear()
 
 
 def load_and_run_app(
     app_module_path: str,
     initial_state: Dict[str, Any],
-    use_mcp_mocks: bool = False
+    use_mcp_mocks: bool = False,
+    keep_mcp_alive: bool = False,
+    quiet: bool = False
 ) -> Dict[str, Any]:
     """
     Load an application module dynamically and execute its workflow with MCP and durability
@@ -23,6 +96,9 @@ def load_and_run_app(
         app_module_path: Python module path (e.g., 'app.workflow')
         initial_state: Initial state dictionary for the workflow
         use_mcp_mocks: Whether to use mock MCP servers (default: False for production)
+        keep_mcp_alive: Keep MCP sessions connected after the run so later calls
+            in this process reuse them (closed at interpreter exit)
+        quiet: Skip the loader's progress messages (errors are still printed)
         
     Returns:
         Final state after workflow execution
@@ -30,113 +106,111 @@ def load_and_run_app(
     The application module must provide:
         - build_workflow() function that returns a LangGraph workflow (compiled or graph)
     """
-    print(f"🔧 Framework: Loading application module '{app_module_path}'...")
+    from framework.observability import init_observability, create_workflow_span
+    from framework.durability import init_durability
+    from framework.mcp_client import init_mcp_client, release_mcp_client, run_on_mcp_loop
+    
+    # Progress output; a no-op when quiet so repeated runs skip the writes
+    say = _silent if quiet else print
+    
+    say(f"🔧 Framework: Loading application module '{app_module_path}'...")
     
     # Initialize observability before loading app
     init_observability()
     
     # Initialize MCP client (always used)
     mcp_client = None
-    print(f"🔧 Framework: Initializing MCP client (mocks: {use_mcp_mocks})...")
+    say(f"🔧 Framework: Initializing MCP client (mocks: {use_mcp_mocks})...")
     try:
-        mcp_client = asyncio.run(init_mcp_client(use_mocks=use_mcp_mocks))
-        print(f"✓ MCP client initialized")
+        mcp_client = run_on_mcp_loop(init_mcp_client(use_mocks=use_mcp_mocks))
+        say(f"✓ MCP client initialized")
     except Exception as e:
         print(f"✗ Failed to initialize MCP client: {e}")
-        raise RuntimeError(f"MCP initialization failed: {e}")
-    
-    # Initialize durability (PostgreSQL checkpointing)
-    durability_manager = init_durability()
-    checkpointer = durability_manager.checkpointer if durability_manager else None
+        raise RuntimeError(f"MCP initialization failed: {e}") from e
     
-    # Check for interrupted workflows to resume
-    interrupted_workflows = []
-    if durability_manager and durability_manager.config.get('resume', {}).get('auto_resume', False):
-        interrupted_workflows = durability_manager.find_interrupted_workflows()
-        if interrupted_workflows:
-            print(f"🔄 Framework: Found {len(interrupted_workflows)} interrupted workflow(s)")
-    
-    # Dynamically import the application module
+    # Everything after MCP init runs under try so the MCP reference is always released
     try:
-        app_module = importlib.import_module(app_module_path)
-    except ImportError as e:
-        raise ImportError(f"Failed to load application module '{app_module_path}': {e}")
-    
-    # Get the build_workflow function from the app
-    if not hasattr(app_module, 'build_workflow'):
-        raise AttributeError(
-            f"Application module '{app_module_path}' must provide a 'build_workflow()' function"
-        )
-    
-    build_workflow = getattr(app_module, 'build_workflow')
-    
-    print(f"✓ Application module loaded successfully")
-    print(f"🔧 Framework: Building workflow...")
-    
-    # Build the workflow (returns either compiled workflow or graph)
-    workflow_result = build_workflow()
-    
-    # Check if it's already compiled or needs compilation
-    # If it has .invoke() method, it's already compiled
-    if hasattr(workflow_result, 'invoke') and not hasattr(workflow_result, 'compile'):
-        # Already compiled - use as is
-        workflow = workflow_result
-    elif hasattr(workflow_result, 'compile'):
-        # It's a graph - compile with checkpointer
-        if checkpointer:
-            workflow = workflow_result.compile(checkpointer=checkpointer)
-            print(f"✓ Workflow compiled with durable checkpointing")
+        # Initialize durability (PostgreSQL checkpointing)
+        durability_manager = init_durability()
+        checkpointer = durability_manager.checkpointer if durability_manager else None
+        
+        # Check for interrupted workflows to resume
+        interrupted_workflows = []
+        if durability_manager and durability_manager.config.get('resume', {}).get('auto_resume', False):
+            interrupted_workflows = durability_manager.find_interrupted_workflows(
+                limit=_MAX_AUTO_RESUME
+            )
+            if interrupted_workflows:
+                say(f"🔄 Framework: Found {len(interrupted_workflows)} interrupted workflow(s)")
+        
+        # Load, build and compile the app's workflow (cached after first run)
+        workflow = _get_workflow(app_module_path, checkpointer, say)
+        
+        # Resume interrupted workflows if any
+        if interrupted_workflows:
+            say(f"\n🔄 Resuming {len(interrupted_workflows)} interrupted workflow(s)...")
+            durability_manager.resume_workflows(workflow, interrupted_workflows)
+        
+        # Generate unique thread ID for new execution
+        thread_id = durability_manager.generate_thread_id() if durability_manager else None
+        
+        if thread_id:
+            say(f"🚀 Framework: Executing workflow (thread_id: {thread_id})...\n")
         else:
-            workflow = workflow_result.compile()
-            print(f"✓ Workflow compiled")
-    else:
-        # Assume it's already compiled
-        workflow = workflow_result
-    
-    # Resume interrupted workflows if any
-    if interrupted_workflows:
-        print(f"\n🔄 Resuming {len(interrupted_workflows)} interrupted workflow(s)...")
-        for interrupted in interrupted_workflows[:5]:  # Limit to 5 for safety
-            thread_id = interrupted['thread_id']
-            config = {"configurable": {"thread_id": thread_id}}
-            durability_manager.resume_workflow(workflow, thread_id, config)
-    
-    # Generate unique thread ID for new execution
-    thread_id = durability_manager.generate_thread_id() if durability_manager else None
-    
-    if thread_id:
-        print(f"🚀 Framework: Executing workflow (thread_id: {thread_id})...\n")
-    else:
-        print(f"🚀 Framework: Executing workflow...\n")
-    
-    # Build config with thread_id for checkpointing
-    invoke_config = {"configurable": {"thread_id": thread_id}} if thread_id else {}
-    
-    # Execute the workflow with observability span
-    try:
+            say(f"🚀 Framework: Executing workflow...\n")
+        
+        # Build config with thread_id for checkpointing (None = LangGraph's default config)
+        invoke_config = {"configurable": {"thread_id": thread_id}} if thread_id else None
+        
+        # Execute the workflow with observability span
         with create_workflow_span("application_workflow") as workflow_span:
-            # Add durability attributes to span
-            workflow_span.set_attribute("framework.app_module", app_module_path)
-            workflow_span.set_attribute("framework.checkpointing_enabled", checkpointer is not None)
-            workflow_span.set_attribute("framework.mcp_enabled", True)
-            workflow_span.set_attribute("framework.mcp_mocks", use_mcp_mocks)
-            if thread_id:
-                workflow_span.set_attribute("framework.thread_id", thread_id)
+            # Only build attributes if the span is exported (not a no-op span)
+            recording = workflow_span.is_recording()
+            if recording:
+                # Add durability attributes to span (one call for the whole set)
+                span_attributes = {
+                    "framework.app_module": app_module_path,
+                    "framework.checkpointing_enabled": checkpointer is not None,
+                    "framework.mcp_enabled": True,
+                    "framework.mcp_mocks": use_mcp_mocks,
+                }
+                if thread_id:
+                    span_attributes["framework.thread_id"] = thread_id
+                workflow_span.set_attributes(span_attributes)
             
             # Invoke workflow with config (includes thread_id for checkpointing)
             result = workflow.invoke(initial_state, config=invoke_config)
             
             # Add framework-level metrics
-            workflow_span.set_attribute("framework.execution_complete", True)
+            if recording:
+                workflow_span.set_attribute("framework.execution_complete", True)
         
         return result
     
     finally:
-        # Cleanup: Shutdown MCP client if it was initialized
+        # Cleanup: release the MCP client; the last active run shuts it down
+        # (unless kept alive for reuse)
         if mcp_client:
-            print(f"\n🔌 Framework: Shutting down MCP client...")
-            asyncio.run(shutdown_mcp_client())
-            print(f"✓ MCP client shutdown complete")
+            if run_on_mcp_loop(release_mcp_client(shutdown=not keep_mcp_alive)):
+                say(f"✓ MCP client shutdown complete")
+
+
+async def aload_and_run_app(
+    app_module_path: str,
+    initial_state: Dict[str, Any],
+    **kwargs: Any
+) -> Dict[str, Any]:
+    """
+    Async variant of load_and_run_app() for callers already on an event loop
+    
+    (e.g. FastAPI handlers). MCP work runs on the framework's own background
+    loop, so the caller's loop is never re-entered; the synchronous workflow
+    runs in a worker thread so the caller's loop stays responsive.
+    Concurrent runs share one MCP client, which is shut down when the last
+    of them finishes; they must all use the same use_mcp_mocks setting.
+    Keyword arguments are passed through to load_and_run_app().
+    """
+    return await asyncio.to_thread(load_and_run_app, app_module_path, initial_state, **kwargs)
 
 
 def get_app_config(app_module_path: str) -> Dict[str, Any]:
@@ -4,12 +4,15 @@ Provides tools to agents via MCP servers
 """
 
 import asyncio
+import atexit
 import json
 import os
 import subprocess
 import sys
+import threading
 from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
@@ -161,27 +164,92 @@ class MCPManager:
     
     def __init__(self):
         self.client: Optional[MCPClient] = None
+        self.use_mocks: Optional[bool] = None  # Server set the client is connected to
+        self.active_users = 0  # init_mcp_client() calls not yet released
         self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self._lifecycle_lock: Optional[asyncio.Lock] = None
     
-    async def initialize(self, servers: List[MCPServerConfig]):
-        """Initialize MCP client and connect to servers"""
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Get the background event loop used for all MCP I/O
+        
+        Started on first use in a daemon thread and kept for the life of the
+        process, so sessions stay bound to one loop and callers don't pay
+        asyncio.run()'s loop setup/teardown on every call.
+        """
+        if self.loop is None:
+            with self._loop_lock:
+                if self.loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(
+                        target=loop.run_forever,
+                        name="mcp-event-loop",
+                        daemon=True
+                    ).start()
+                    self.loop = loop
+                    atexit.register(self._shutdown_at_exit)
+        return self.loop
+    
+    def _shutdown_at_exit(self):
+        """Disconnect sessions still open at interpreter exit, then stop the loop"""
+        try:
+            if self.client:
+                asyncio.run_coroutine_threadsafe(self.shutdown(), self.loop).result(timeout=5)
+        except Exception:
+            pass
+        self.loop.call_soon_threadsafe(self.loop.stop)
+    
+    def run(self, coro) -> Any:
+        """Run a coroutine on the background loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self.get_loop()).result()
+    
+    def lifecycle_lock(self) -> asyncio.Lock:
+        """
+        Lock serializing client setup and teardown
+        
+        Created on first use from a coroutine running on the MCP loop; all
+        lifecycle coroutines run there, so concurrent init_mcp_client()
+        calls connect only once and never see a half-connected client.
+        """
+        if self._lifecycle_lock is None:
+            self._lifecycle_lock = asyncio.Lock()
+        return self._lifecycle_lock
+    
+    async def initialize(self, servers: List[MCPServerConfig], use_mocks: Optional[bool] = None):
+        """Initialize MCP client and connect to servers (callers hold lifecycle_lock())"""
         print("🚀 Initializing MCP Client...")
         
-        self.client = MCPClient()
+        client = MCPClient()
         
-        # Connect to all servers
-        for server_config in servers:
-            await self.client.connect_server(server_config)
+        # Connect to all servers; drop partial connections on failure
+        try:
+            for server_config in servers:
+                await client.connect_server(server_config)
+        except Exception:
+            await client.disconnect_all()
+            raise
+        
+        # Publish the client only once it is fully connected
+        self.client = client
+        self.use_mocks = use_mocks
         
         print(f"✓ MCP Client initialized with {len(servers)} server(s)")
-        return self.client
+        return client
     
     async def shutdown(self):
         """Shutdown MCP client and disconnect from servers"""
+        async with self.lifecycle_lock():
+            await self._disconnect()
+    
+    async def _disconnect(self):
+        """Disconnect the current client (callers hold lifecycle_lock())"""
         if self.client:
             print("🔌 Shutting down MCP Client...")
             await self.client.disconnect_all()
             self.client = None
+            self.use_mocks = None
+            self.active_users = 0
             print("✓ MCP Client shutdown complete")
     
     def get_client(self) -> Optional[MCPClient]:
@@ -189,30 +257,26 @@ class MCPManager:
         return self.client
 
 
-# Global MCP manager instance
-_mcp_manager: Optional[MCPManager] = None
-
-
+# Global MCP manager instance: created on first call, then returned from the cache
+@lru_cache(maxsize=None)
 def get_mcp_manager() -> MCPManager:
     """Get or create the global MCP manager"""
-    global _mcp_manager
-    if _mcp_manager is None:
-        _mcp_manager = MCPManager()
-    return _mcp_manager
+    return MCPManager()
 
 
 async def init_mcp_client(use_mocks: bool = False) -> MCPClient:
     """
     Initialize MCP client with appropriate servers (real or mock)
     
+    Each call takes a reference on the shared client; pair it with
+    release_mcp_client() so the client is only shut down by its last user.
+    
     Args:
         use_mocks: If True, use mock MCP servers for testing
     
     Returns:
         MCPClient instance
     """
-    manager = get_mcp_manager()
-    
     # Determine which servers to use
     if use_mocks:
         servers = [
@@ -261,16 +325,60 @@ async def init_mcp_client(use_mocks: bool = False) -> MCPClient:
             )
         ]
     
-    client = await manager.initialize(servers)
-    return client
+    manager = get_mcp_manager()
+    async with manager.lifecycle_lock():
+        # Reuse live sessions if already connected to the same server set
+        if manager.client is not None:
+            if manager.use_mocks == use_mocks:
+                manager.active_users += 1
+                return manager.client
+            if manager.active_users:
+                raise RuntimeError(
+                    f"MCP client is in use with mocks={manager.use_mocks}; "
+                    f"cannot switch to mocks={use_mocks} while runs are active"
+                )
+            await manager._disconnect()
+        
+        client = await manager.initialize(servers, use_mocks)
+        manager.active_users = 1
+        return client
+
+
+async def release_mcp_client(shutdown: bool = True) -> bool:
+    """
+    Release a reference taken by init_mcp_client()
+    
+    Args:
+        shutdown: Shut the client down if this was its last user (False keeps
+            the sessions connected for later calls)
+    
+    Returns:
+        True if the client was shut down
+    """
+    manager = get_mcp_manager()
+    async with manager.lifecycle_lock():
+        manager.active_users = max(manager.active_users - 1, 0)
+        if not shutdown or manager.active_users or manager.client is None:
+            return False
+        await manager._disconnect()
+        return True
 
 
 async def shutdown_mcp_client():
-    """Shutdown MCP client"""
+    """Shutdown MCP client, regardless of other users"""
     manager = get_mcp_manager()
     await manager.shutdown()
 
 
+def run_on_mcp_loop(coro) -> Any:
+    """
+    Run an MCP coroutine (e.g. init_mcp_client()) from synchronous code
+    
+    Uses the manager's persistent background loop instead of asyncio.run().
+    """
+    return get_mcp_manager().run(coro)
+
+
 def run_async_tool_call(server_name: str, tool_name: str, arguments: Dict[str, Any]) -> Any:
     """
     Helper function to call MCP tools from synchronous code (like LangGraph nodes)
@@ -289,6 +397,10 @@ def run_async_tool_call(server_name: str, tool_name: str, arguments: Dict[str, A
     if not client:
         raise RuntimeError("MCP client not initialized. Call init_mcp_client() first.")
     
+    # Client initialized via run_on_mcp_loop: its sessions live on that loop
+    if manager.loop is not None:
+        return manager.run(client.call_tool(server_name, tool_name, arguments))
+    
     # Run in event loop
     loop = asyncio.get_event_loop()
     if loop.is_running():
@@ -9,7 +9,7 @@ Features:
 - Automatic pruning with optional summarization
 """
 
-from typing import TypedDict, List, Dict, Any, Annotated, Callable
+from typing import TypedDict, List, Dict, Any, Annotated, Callable, Optional
 from functools import wraps
 from datetime import datetime
 import json
@@ -440,6 +440,29 @@ Summary:"""
         })
         return state
     
+    @staticmethod
+    def get_summary(state: Dict[str, Any]) -> Optional[Dict[str, str]]:
+        """
+        Get the conversation summary message, if any
+        
+        Args:
+            state: Workflow state
+        
+        Returns:
+            The summary message dict, or None if there is no summary
+        """
+        history = state.get('conversation_history') or ()
+        idx = MemoryManager._find_summary_index(history)
+        return history[idx] if idx is not None else None
+    
+    @staticmethod
+    def _find_summary_index(history: List[Dict[str, str]]) -> Optional[int]:
+        """Index of the first summary message in history, or None"""
+        for i, msg in enumerate(history):
+            if msg['role'] == 'summary':
+                return i
+        return None
+    
     @staticmethod
     def get_conversation_history(state: Dict[str, Any]) -> List[Dict[str, str]]:
         """
@@ -464,7 +487,7 @@ Summary:"""
         Returns:
             Number of messages
         """
-        return len(state.get('conversation_history', []))
+        return len(state.get('conversation_history') or ())
     
     @staticmethod
     def _summarize_messages(messages: List[Dict[str, str]], llm=None) -> str:
@@ -516,7 +539,7 @@ Summary:"""
         config = state.get('_memory_config', {})
         max_msgs = config.get('max_messages', MemoryManager.DEFAULT_MAX_MESSAGES)
         strategy = config.get('prune_strategy', 'keep_recent')
-        history = state.get('conversation_history', [])
+        history = state.get('conversation_history') or ()
         
         if len(history) <= max_msgs:
             return state  # No pruning needed
@@ -532,11 +555,7 @@ Summary:"""
             summarization_llm = llm or config.get('summarization_llm')
             
             # Check if we already have a summary
-            summary_idx = None
-            for i, msg in enumerate(history):
-                if msg['role'] == 'summary':
-                    summary_idx = i
-                    break
+            summary_idx = MemoryManager._find_summary_index(history)
             
             if summary_idx is not None:
                 # We have an existing summary - update it
@@ -571,11 +590,7 @@ Summary:"""
                     except Exception as e:
                         print(f"   ⚠️  Summarization failed ({e}), falling back to keep_recent")
                         # Fallback to keep_recent strategy
-                        if system_msg:
-                            recent = history[-(max_msgs - 1):]
-                            state['conversation_history'] = [system_msg] + recent
-                        else:
-                            state['conversation_history'] = history[-max_msgs:]
+                        MemoryManager._keep_recent(state, history, system_msg, max_msgs)
                 
             else:
                 # First time summarizing - no existing summary
@@ -604,22 +619,28 @@ Summary:"""
                     except Exception as e:
                         print(f"   ⚠️  Summarization failed ({e}), falling back to keep_recent")
                         # Fallback to keep_recent strategy
-                        if system_msg:
-                            recent = history[-(max_msgs - 1):]
-                            state['conversation_history'] = [system_msg] + recent
-                        else:
-                            state['conversation_history'] = history[-max_msgs:]
+                        MemoryManager._keep_recent(state, history, system_msg, max_msgs)
         
         else:
             # Original 'keep_recent' strategy
-            if system_msg:
-                recent = history[-(max_msgs - 1):]
-                state['conversation_history'] = [system_msg] + recent
-            else:
-                state['conversation_history'] = history[-max_msgs:]
+            MemoryManager._keep_recent(state, history, system_msg, max_msgs)
         
         return state
     
+    @staticmethod
+    def _keep_recent(
+        state: Dict[str, Any],
+        history: List[Dict[str, str]],
+        system_msg: Optional[Dict[str, str]],
+        max_msgs: int
+    ):
+        """Keep the system message plus the most recent messages"""
+        if system_msg:
+            recent = history[-(max_msgs - 1):]
+            state['conversation_history'] = [system_msg] + recent
+        else:
+            state['conversation_history'] = history[-max_msgs:]
+    
     @staticmethod
     def get_langchain_messages(state: Dict[str, Any]) -> List:
         """
@@ -632,10 +653,15 @@ Summary:"""
         Returns:
             List of LangChain message objects
         """
+        return MemoryManager._convert_to_langchain(state.get('conversation_history') or ())
+    
+    @staticmethod
+    def _convert_to_langchain(messages: List[Dict[str, str]]) -> List:
+        """Convert internal messages to LangChain messages (summary becomes a system message)"""
         from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
         
         lc_messages = []
-        for msg in state.get('conversation_history', []):
+        for msg in messages:
             role = msg.get('role', '')
             content = msg.get('content', '')
             
@@ -879,6 +905,71 @@ def requires_conversation_memory(func: Callable) -> Callable:
     return wrapper
 
 
+# ============================================================================
+# LangChain Message Cache - Incremental Conversion
+# ============================================================================
+
+class LangChainMessageCache:
+    """
+    Incrementally converts conversation history to LangChain messages
+    
+    Holds the converted messages on this instance (never in workflow state,
+    so nothing extra is checkpointed). Each convert() call only converts
+    messages added since the previous call. To stay O(new messages), only
+    the last converted message is compared against the history: pruning,
+    summarizing or clearing shifts or shortens the history and triggers a
+    full conversion, but an in-place edit of an earlier message is not
+    detected - call clear() after editing history directly.
+    
+    Usage:
+        lc_cache = LangChainMessageCache()
+        ...
+        messages = lc_cache.convert(MemoryManager.get_conversation_history(state))
+    """
+    
+    def __init__(self):
+        self._last_key: Optional[tuple] = None  # (role, content) of the last converted message
+        self._messages: List = []
+    
+    def convert(self, history: List[Dict[str, str]]) -> List:
+        """
+        Convert history, reusing messages converted by earlier calls
+        
+        Args:
+            history: Internal conversation history
+        
+        Returns:
+            List of LangChain message objects (same as MemoryManager.get_langchain_messages).
+            The list is owned by the cache and extended by later calls; copy it
+            before modifying it.
+        """
+        cached = len(self._messages)
+        
+        # Reuse the cached messages only if the last one still lines up
+        if cached and (
+            len(history) < cached
+            or self._message_key(history[cached - 1]) != self._last_key
+        ):
+            self.clear()
+            cached = 0
+        
+        if len(history) > cached:
+            self._messages.extend(MemoryManager._convert_to_langchain(history[cached:]))
+            self._last_key = self._message_key(history[-1])
+        
+        return self._messages
+    
+    def clear(self):
+        """Drop all cached messages"""
+        self._last_key = None
+        self._messages = []
+    
+    @staticmethod
+    def _message_key(msg: Dict[str, str]) -> tuple:
+        """Identity of a history message for cache validation"""
+        return (msg.get('role', ''), msg.get('content', ''))
+
+
 # ============================================================================
 # Memory Inspector - Debugging and Visualization
 # ============================================================================
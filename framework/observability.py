@@ -7,6 +7,7 @@ Provides OpenTelemetry instrumentation for the Daily Task Planner Agent
 """
 
 import functools
+import threading
 import time
 import yaml
 import os
@@ -17,6 +18,7 @@ from datetime import datetime
 from opentelemetry import trace, metrics
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF
 from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader, ConsoleMetricExporter
 from opentelemetry.sdk.resources import Resource
@@ -28,6 +30,7 @@ _config = None
 _tracer = None
 _meter = None
 _initialized = False
+_init_lock = threading.Lock()
 
 # ============================================================================
 # Configuration Loading
@@ -60,7 +63,18 @@ def load_config() -> Dict[str, Any]:
 # ============================================================================
 
 def init_observability():
-    """Initialize OpenTelemetry providers and exporters"""
+    """Initialize OpenTelemetry providers and exporters (once per process)"""
+    # Fast path for every call after the first: one global read, no lock
+    if _initialized:
+        return
+    
+    # Serialize first-time setup so concurrent runs (e.g. aload_and_run_app)
+    # can't install providers twice
+    with _init_lock:
+        _init_providers()
+
+def _init_providers():
+    """Create and register the tracer/meter providers; caller holds _init_lock"""
     global _config, _tracer, _meter, _initialized
     
     if _initialized:
@@ -79,18 +93,24 @@ def init_observability():
         "service.version": _config.get('service_version', '1.0.0'),
     })
     
-    # Initialize Tracing
-    trace_provider = TracerProvider(resource=resource)
+    # Check which trace exporters are enabled (OTLP: handle both old boolean and new dict format)
+    console_enabled = _config.get('exporters', {}).get('console', True)
+    otlp_config = _config.get('exporters', {}).get('otlp', False)
+    otlp_traces_enabled = otlp_config.get('traces', True) if isinstance(otlp_config, dict) else otlp_config
+    
+    # Initialize Tracing. With no trace exporter nothing would consume the
+    # spans, so sample none: spans then report is_recording() == False and
+    # instrumented code skips building their attributes
+    if console_enabled or otlp_traces_enabled:
+        trace_provider = TracerProvider(resource=resource)
+    else:
+        trace_provider = TracerProvider(resource=resource, sampler=ALWAYS_OFF)
     
     # Add trace exporters
-    if _config.get('exporters', {}).get('console', True):
+    if console_enabled:
         console_exporter = ConsoleSpanExporter()
         trace_provider.add_span_processor(BatchSpanProcessor(console_exporter))
     
-    # Check if OTLP traces are enabled (handle both old boolean and new dict format)
-    otlp_config = _config.get('exporters', {}).get('otlp', False)
-    otlp_traces_enabled = otlp_config.get('traces', True) if isinstance(otlp_config, dict) else otlp_config
-    
     if otlp_traces_enabled:
         otlp_exporter = OTLPSpanExporter(
             endpoint=_config.get('otlp_endpoint', 'http://localhost:4317'),
@@ -202,6 +222,12 @@ def get_metrics() -> AgentMetrics:
 # Instrumentation Decorators
 # ============================================================================
 
+def _get_field(state: Any, key: str, default: Any = None) -> Any:
+    """Read a field from a dict state or an attribute-based (dataclass) state"""
+    if isinstance(state, dict):
+        return state.get(key, default)
+    return getattr(state, key, default)
+
 def instrument_agent(agent_func: Callable, agent_name: str) -> Callable:
     """
     Decorator to instrument an agent function with tracing and metrics
@@ -227,7 +253,7 @@ def instrument_agent(agent_func: Callable, agent_name: str) -> Callable:
             attributes={
                 "agent.name": agent_name,
                 "agent.type": "task_planner",
-                "workflow.time_range_hours": state.get('time_range_hours', 0)
+                "workflow.time_range_hours": _get_field(state, 'time_range_hours', 0)
             }
         ) as span:
             
@@ -246,27 +272,27 @@ def instrument_agent(agent_func: Callable, agent_name: str) -> Callable:
                 
                 # Record specific metrics based on agent
                 if agent_name == "email_collector" and metrics.messages_collected:
-                    email_count = len(result.get('emails', []))
+                    email_count = len(_get_field(result, 'emails', []))
                     metrics.messages_collected.add(email_count, {"source": "email"})
                     span.set_attribute("emails.count", email_count)
                 
                 elif agent_name == "slack_collector" and metrics.messages_collected:
-                    slack_count = len(result.get('slack_messages', []))
+                    slack_count = len(_get_field(result, 'slack_messages', []))
                     metrics.messages_collected.add(slack_count, {"source": "slack"})
                     span.set_attribute("slack_messages.count", slack_count)
                 
                 elif agent_name == "task_extractor" and metrics.tasks_extracted:
-                    task_count = len(result.get('tasks', []))
+                    task_count = len(_get_field(result, 'tasks', []))
                     metrics.tasks_extracted.add(task_count, {"type": "extracted"})
                     span.set_attribute("tasks.extracted", task_count)
                 
                 elif agent_name == "task_prioritizer" and metrics.tasks_extracted:
-                    prioritized_count = len(result.get('prioritized_tasks', []))
+                    prioritized_count = len(_get_field(result, 'prioritized_tasks', []))
                     span.set_attribute("tasks.prioritized", prioritized_count)
                     
                     # Count by priority
                     priority_counts = {'P0': 0, 'P1': 0, 'P2': 0, 'P3': 0}
-                    for task in result.get('prioritized_tasks', []):
+                    for task in _get_field(result, 'prioritized_tasks', []):
                         p = task.get('priority', 'P3')
                         priority_counts[p] += 1
                     
@@ -274,14 +300,14 @@ def instrument_agent(agent_func: Callable, agent_name: str) -> Callable:
                         span.set_attribute(f"tasks.priority.{priority}", count)
                 
                 elif agent_name == "email_sender":
-                    span.set_attribute("email.sent", result.get('email_sent', False))
-                    span.set_attribute("email.status", result.get('email_status', ''))
+                    span.set_attribute("email.sent", _get_field(result, 'email_sent', False))
+                    span.set_attribute("email.status", _get_field(result, 'email_status', ''))
                 
                 # Record errors if any
-                error_count = len(result.get('errors', []))
+                error_count = len(_get_field(result, 'errors', []))
                 if error_count > 0:
                     span.set_attribute("errors.count", error_count)
-                    for i, error in enumerate(result.get('errors', [])[:5]):  # Limit to 5
+                    for i, error in enumerate(_get_field(result, 'errors', [])[:5]):  # Limit to 5
                         span.add_event(f"error_{i}", {"error.message": error})
                 
                 span.set_status(trace.Status(trace.StatusCode.OK))
@@ -329,8 +355,12 @@ class DummySpan:
         pass
     def set_attribute(self, *args):
         pass
+    def set_attributes(self, *args):
+        pass
     def add_event(self, *args):
         pass
+    def is_recording(self):
+        return False
 
 # ============================================================================
 # Logging Helpers
@@ -341,8 +371,9 @@ def log_event(event_name: str, attributes: Dict[str, Any] = None):
     if not _initialized or not _config.get('enabled', True):
         return
     
+    # get_current_span() never returns None; non-recording spans drop events
     current_span = trace.get_current_span()
-    if current_span:
+    if current_span.is_recording():
         current_span.add_event(event_name, attributes or {})
 
 def log_state_transition(from_agent: str, to_agent: str, state_summary: Dict[str, Any] = None):
@@ -350,6 +381,11 @@ def log_state_transition(from_agent: str, to_agent: str, state_summary: Dict[str
     if not _initialized or not _config.get('enabled', True):
         return
     
+    # Don't build the attribute payload if nothing will record it
+    current_span = trace.get_current_span()
+    if not current_span.is_recording():
+        return
+    
     attributes = {
         "transition.from": from_agent,
         "transition.to": to_agent,
@@ -358,7 +394,7 @@ def log_state_transition(from_agent: str, to_agent: str, state_summary: Dict[str
     if state_summary:
         attributes.update(state_summary)
     
-    log_event("state_transition", attributes)
+    current_span.add_event("state_transition", attributes)
 
 # ============================================================================
 # Auto-Instrumenting StateGraph
@@ -26,44 +26,47 @@ def setup_postgres_database(connection_string: str):
     print(f"   Connection: {_mask_password(connection_string)}")
     
     try:
-        # Connect to PostgreSQL
+        # Connect to PostgreSQL (closed automatically when the block exits)
         print("   Connecting to database...")
-        conn = psycopg.connect(connection_string, autocommit=True, prepare_threshold=0)
-        
-        # Initialize PostgresSaver
-        print("   Initializing checkpoint tables...")
-        checkpointer = PostgresSaver(conn)
-        
-        # Create tables (idempotent operation)
-        checkpointer.setup()
-        
-        print("\n✅ PostgreSQL setup complete!")
-        print("\nCreated tables:")
-        print("  • checkpoints         - Stores workflow state snapshots")
-        print("  • checkpoint_writes   - Stores pending writes")
-        
-        # Verify tables exist
-        print("\n📊 Verifying tables...")
-        with conn.cursor() as cur:
-            cur.execute("""
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'public' 
-                AND table_name IN ('checkpoints', 'checkpoint_writes')
-                ORDER BY table_name
-            """)
-            tables = [row[0] for row in cur.fetchall()]
+        with psycopg.connect(connection_string, autocommit=True, prepare_threshold=0) as conn:
+            
+            # Initialize PostgresSaver
+            print("   Initializing checkpoint tables...")
+            checkpointer = PostgresSaver(conn)
+            
+            # Create tables (idempotent operation)
+            checkpointer.setup()
+            
+            print("\n✅ PostgreSQL setup complete!")
+            print("\nCreated tables:")
+            print("  • checkpoints         - Stores workflow state snapshots")
+            print("  • checkpoint_writes   - Stores pending writes")
             
-            if len(tables) == 2:
-                print(f"   ✓ Found {len(tables)} tables")
-                for table in tables:
-                    cur.execute(f"SELECT COUNT(*) FROM {table}")
-                    count = cur.fetchone()[0]
-                    print(f"   ✓ {table}: {count} rows")
-            else:
-                print(f"   ⚠️  Warning: Expected 2 tables, found {len(tables)}")
+            # Verify tables exist
+            print("\n📊 Verifying tables...")
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT table_name 
+                    FROM information_schema.tables 
+                    WHERE table_schema = 'public' 
+                    AND table_name IN ('checkpoints', 'checkpoint_writes')
+                    ORDER BY table_name
+                """)
+                tables = [row[0] for row in cur.fetchall()]
+                
+                if len(tables) == 2:
+                    print(f"   ✓ Found {len(tables)} tables")
+                    # Both row counts in one round trip
+                    cur.execute("""
+                        SELECT (SELECT COUNT(*) FROM checkpoint_writes),
+                               (SELECT COUNT(*) FROM checkpoints)
+                    """)
+                    counts = cur.fetchone()
+                    for table, count in zip(('checkpoint_writes', 'checkpoints'), counts):
+                        print(f"   ✓ {table}: {count} rows")
+                else:
+                    print(f"   ⚠️  Warning: Expected 2 tables, found {len(tables)}")
         
-        conn.close()
         print("\n✨ Database is ready for durable executions!")
         
     except psycopg.OperationalError as e:
@@ -146,12 +146,12 @@ class MockEmailMCPServer:
         hours = args.get('hours', 24)
         max_results = args.get('max_results', 50)
         
-        # Return mock emails with timestamps
-        emails = []
-        for email in MockEmailConfig.MOCK_EMAILS[:max_results]:
-            email_copy = email.copy()
-            email_copy['timestamp'] = datetime.now().isoformat()
-            emails.append(email_copy)
+        # Return mock emails with timestamps (formatted once per call)
+        timestamp = datetime.now().isoformat()
+        emails = [
+            {**email, 'timestamp': timestamp}
+            for email in MockEmailConfig.MOCK_EMAILS[:max_results]
+        ]
         
         result = {
             'success': True,
@@ -125,15 +125,14 @@ class MockSlackMCPServer:
         include_channels = args.get('include_channels', True)
         include_mentions = args.get('include_mentions', True)
         
-        # Filter mock messages based on settings
+        # Filter mock messages based on settings (timestamp formatted once per call)
+        timestamp = datetime.now().isoformat()
         messages = []
         for msg in MockSlackConfig.MOCK_MESSAGES:
             if (msg['type'] == 'dm' and include_dms) or \
                (msg['type'] == 'channel' and include_channels) or \
                (msg['type'] == 'mention' and include_mentions):
-                msg_copy = msg.copy()
-                msg_copy['timestamp'] = datetime.now().isoformat()
-                messages.append(msg_copy)
+                messages.append({**msg, 'timestamp': timestamp})
         
         result = {
             'success': True,
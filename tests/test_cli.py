@@ -0,0 +1,70 @@
+"""
+Test FrameworkCLI Argument Parsing
+
+These tests verify that the fast argument path agrees with argparse for
+the standard flags and defers to argparse for everything else.
+"""
+
+import pytest
+
+from framework.cli import FrameworkCLI
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+@pytest.fixture
+def cli():
+    """CLI with only the standard arguments"""
+    return FrameworkCLI(title="Test App", description="Test description")
+
+
+# ============================================================================
+# Test: Fast Path
+# ============================================================================
+
+class TestFastParse:
+    """Test the argparse-free path for standard flags"""
+    
+    @pytest.mark.parametrize("argv", [
+        [],
+        ['--mock'],
+        ['--debug', '--resume'],
+        ['--config-dir', 'custom'],
+        ['--mock', '--config-dir', 'custom', '--debug'],
+    ])
+    def test_matches_argparse(self, cli, argv):
+        """Standard flags produce the same namespace as argparse"""
+        fast = cli._fast_parse(argv)
+        
+        assert fast is not None
+        assert vars(fast) == vars(FrameworkCLI("t", "d").parser.parse_args(argv))
+    
+    @pytest.mark.parametrize("argv", [
+        ['-h'],
+        ['--help'],
+        ['--moc'],                  # abbreviation (argparse resolves these)
+        ['--config-dir=custom'],
+        ['--config-dir'],           # missing value
+        ['--config-dir', '--mock'], # flag where the value should be
+        ['positional'],
+    ])
+    def test_defers_to_argparse(self, cli, argv):
+        """Anything the fast path doesn't fully understand returns None"""
+        assert cli._fast_parse(argv) is None
+    
+    def test_defers_when_custom_arguments_registered(self, cli):
+        """Custom arguments need the real parser"""
+        cli.add_argument('--input', type=str)
+        
+        assert cli._fast_parse(['--mock']) is None
+    
+    def test_queued_arguments_reach_parser(self, cli):
+        """Arguments added before the parser exists are applied when it is built"""
+        cli.add_argument('--input', type=str)
+        
+        args = cli.parser.parse_args(['--input', 'data.json', '--mock'])
+        
+        assert args.input == 'data.json'
+        assert args.mock is True
@@ -0,0 +1,208 @@
+"""
+Test Simple Data Processor Agents
+
+These tests cover the extract, transform, report and streaming agents
+of the simple-data-processor example.
+"""
+
+import importlib
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+
+# Example directory (its package is also named 'app')
+PROCESSOR_DIR = Path(__file__).parent.parent / "examples" / "simple-data-processor"
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+def _pop_app_modules():
+    """Remove and return any imported 'app' package modules"""
+    return {
+        name: sys.modules.pop(name)
+        for name in list(sys.modules)
+        if name == 'app' or name.startswith('app.')
+    }
+
+
+@pytest.fixture(scope="module")
+def processor():
+    """Import the processor agents without clashing with another 'app' package"""
+    saved = _pop_app_modules()
+    sys.path.insert(0, str(PROCESSOR_DIR))
+    try:
+        agents = importlib.import_module('app.agents.processor_agents')
+        state_module = importlib.import_module('app.state')
+        yield agents, state_module
+    finally:
+        sys.path.remove(str(PROCESSOR_DIR))
+        _pop_app_modules()
+        sys.modules.update(saved)
+
+
+# ============================================================================
+# Test: Extract
+# ============================================================================
+
+class TestExtract:
+    """Test reading the source data"""
+    
+    def test_sample_data_not_shared_with_state(self, processor, tmp_path):
+        """Mutating extracted sample records leaves the module sample intact"""
+        agents, state_module = processor
+        state = state_module.DataProcessorState(source_file=str(tmp_path / "missing.json"))
+        
+        agents.data_extractor(state)
+        state.raw_data[0]['score'] = -1
+        
+        assert agents._SAMPLE_DATA[0]['score'] == 85
+
+
+# ============================================================================
+# Test: Transform and Load
+# ============================================================================
+
+class TestTransform:
+    """Test record transformation and the batch JSON output"""
+    
+    def test_transformed_rows_are_plain_dicts(self, processor):
+        """Rows kept in checkpointed state are builtin dicts"""
+        agents, state_module = processor
+        state = state_module.DataProcessorState(
+            raw_data=[{'id': 1, 'name': 'test', 'score': 95}]
+        )
+        
+        result = agents.data_transformer(state)
+        
+        assert result.transformed_data == [
+            {'id': 1, 'name': 'TEST', 'score': 95, 'grade': 'A', 'processed': True}
+        ]
+    
+    def test_loader_writes_rows_as_json(self, processor, tmp_path):
+        """The batch output file holds the transformed rows unchanged"""
+        agents, state_module = processor
+        rows = [agents._transform_record({'id': i, 'name': f'n{i}', 'score': 75}) for i in range(2)]
+        state = state_module.DataProcessorState(
+            output_file=str(tmp_path / "out.json"),
+            transformed_data=rows,
+        )
+        
+        agents.data_loader(state)
+        
+        assert state.records_processed == 2
+        assert json.loads((tmp_path / "out.json").read_text()) == rows
+
+
+# ============================================================================
+# Test: Grading
+# ============================================================================
+
+class TestGrading:
+    """Test the score -> letter grade mapping"""
+    
+    @pytest.mark.parametrize("score, grade", [
+        (0, 'F'), (59, 'F'), (60, 'D'), (69, 'D'), (70, 'C'),
+        (79, 'C'), (80, 'B'), (89, 'B'), (90, 'A'), (100, 'A'),
+    ])
+    def test_grade_boundaries(self, processor, score, grade):
+        """Each threshold starts the next grade"""
+        agents, _ = processor
+        assert agents._calculate_grade(score) == grade
+
+
+# ============================================================================
+# Test: Report
+# ============================================================================
+
+class TestReport:
+    """Test report rendering"""
+    
+    def test_report_contents(self, processor):
+        """Report lists status, sample records, overflow count and errors"""
+        agents, state_module = processor
+        records = [agents._transform_record({'id': i, 'name': f'n{i}', 'score': 85}) for i in range(5)]
+        state = state_module.DataProcessorState(
+            transformed_data=records,
+            records_processed=5,
+            load_status="Successfully wrote 5 records",
+            errors=["Something failed"],
+        )
+        
+        report = agents.report_generator(state).report
+        
+        assert "Records Processed: 5" in report
+        assert "Status: Successfully wrote 5 records" in report
+        assert "  • N0: Score 85 → Grade B" in report
+        assert "N3" not in report
+        assert "... and 2 more" in report
+        assert "  • Something failed" in report
+    
+    def test_report_reflects_state_changes(self, processor):
+        """A cached report is not reused after the state changes"""
+        agents, state_module = processor
+        state = state_module.DataProcessorState(load_status="first")
+        first = agents.report_generator(state).report
+        
+        state.load_status = "second"
+        second = agents.report_generator(state).report
+        
+        assert "Status: first" in first
+        assert "Status: second" in second
+
+
+# ============================================================================
+# Test: Streaming Output
+# ============================================================================
+
+class TestStreaming:
+    """Test the single-pass NDJSON path"""
+    
+    def test_etl_stream_writes_ndjson(self, processor, tmp_path):
+        """One transformed JSON object per line, plus a report sample"""
+        agents, _ = processor
+        output = tmp_path / "out.ndjson"
+        raw = [{'id': i, 'name': f'n{i}', 'score': 50 + 10 * i} for i in range(5)]
+        
+        count, sample = agents.etl_stream(raw, str(output))
+        
+        lines = output.read_text().splitlines()
+        assert count == 5
+        assert len(sample) == agents._REPORT_SAMPLE_SIZE
+        assert [json.loads(line) for line in lines] == [
+            {'id': i, 'name': f'N{i}', 'score': 50 + 10 * i,
+             'grade': agents._calculate_grade(50 + 10 * i), 'processed': True}
+            for i in range(5)
+        ]
+    
+    def test_etl_stream_failure_keeps_previous_output(self, processor, tmp_path):
+        """A failure partway through leaves no truncated or temporary file"""
+        agents, _ = processor
+        output = tmp_path / "out.ndjson"
+        output.write_text("previous\n")
+        
+        with pytest.raises(AttributeError):
+            agents.etl_stream([{'id': 1, 'name': 'a', 'score': 90}, None], str(output))
+        
+        assert output.read_text() == "previous\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.ndjson"]
+    
+    def test_stream_processor_uses_ndjson_file(self, processor, tmp_path):
+        """Streaming mode writes to stream_output_file, not the batch JSON file"""
+        agents, state_module = processor
+        state = state_module.DataProcessorState(
+            source_file=str(tmp_path / "missing.json"),
+            output_file=str(tmp_path / "out.json"),
+            stream_output_file=str(tmp_path / "out.ndjson"),
+            streaming=True,
+        )
+        
+        agents.stream_processor(state)
+        
+        assert state.records_processed == 3
+        assert not (tmp_path / "out.json").exists()
+        assert len((tmp_path / "out.ndjson").read_text().splitlines()) == 3
@@ -0,0 +1,112 @@
+"""
+Test MCP Client Lifecycle
+
+These tests cover how concurrent callers share the global MCP client
+and when it is shut down.
+Server connections are replaced with an in-process fake, so no MCP
+servers are started.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from framework.mcp_client import (
+    MCPClient,
+    get_mcp_manager,
+    init_mcp_client,
+    release_mcp_client,
+    run_on_mcp_loop,
+    shutdown_mcp_client,
+)
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+@pytest.fixture
+def connections(monkeypatch):
+    """Record server connections instead of spawning server processes"""
+    connected = []
+    
+    async def fake_connect(self, config):
+        await asyncio.sleep(0.02)  # Let concurrent callers interleave
+        connected.append(config.name)
+        self.sessions[config.name] = object()
+        self.servers[config.name] = config
+    
+    monkeypatch.setattr(MCPClient, 'connect_server', fake_connect)
+    yield connected
+    run_on_mcp_loop(shutdown_mcp_client())
+
+
+# ============================================================================
+# Test: Initialization
+# ============================================================================
+
+class TestInitialization:
+    """Test client setup under concurrent first calls"""
+    
+    def test_concurrent_init_connects_once(self, connections):
+        """Callers racing on the first init share one connected client"""
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            clients = list(executor.map(
+                lambda _: run_on_mcp_loop(init_mcp_client(use_mocks=True)),
+                range(4)
+            ))
+        
+        assert len({id(client) for client in clients}) == 1
+        assert sorted(connections) == ['email', 'slack']
+        assert get_mcp_manager().use_mocks is True
+    
+    def test_failed_connect_publishes_nothing(self, connections, monkeypatch):
+        """A client is only published once every server is connected"""
+        async def failing_connect(self, config):
+            if config.name == 'slack':
+                raise ConnectionError("slack unavailable")
+            self.sessions[config.name] = object()
+            self.servers[config.name] = config
+        
+        monkeypatch.setattr(MCPClient, 'connect_server', failing_connect)
+        
+        with pytest.raises(ConnectionError):
+            run_on_mcp_loop(init_mcp_client(use_mocks=True))
+        
+        assert get_mcp_manager().client is None
+        assert get_mcp_manager().use_mocks is None
+
+
+# ============================================================================
+# Test: Shared Client Release
+# ============================================================================
+
+class TestRelease:
+    """Test that only the last active user shuts the client down"""
+    
+    def test_last_release_shuts_down(self, connections):
+        """Earlier releases leave the client connected for the remaining users"""
+        first = run_on_mcp_loop(init_mcp_client(use_mocks=True))
+        second = run_on_mcp_loop(init_mcp_client(use_mocks=True))
+        
+        assert first is second
+        assert run_on_mcp_loop(release_mcp_client()) is False
+        assert get_mcp_manager().client is first
+        assert run_on_mcp_loop(release_mcp_client()) is True
+        assert get_mcp_manager().client is None
+    
+    def test_release_can_keep_client(self, connections):
+        """shutdown=False keeps the sessions for later calls"""
+        client = run_on_mcp_loop(init_mcp_client(use_mocks=True))
+        
+        assert run_on_mcp_loop(release_mcp_client(shutdown=False)) is False
+        assert run_on_mcp_loop(init_mcp_client(use_mocks=True)) is client
+        assert len(connections) == 2
+    
+    def test_switching_servers_while_in_use_fails(self, connections):
+        """A run can't reconnect to other servers under an active run"""
+        run_on_mcp_loop(init_mcp_client(use_mocks=True))
+        
+        with pytest.raises(RuntimeError, match="in use"):
+            run_on_mcp_loop(init_mcp_client(use_mocks=False))
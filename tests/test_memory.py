@@ -0,0 +1,138 @@
+"""
+Test Conversation Memory Helpers
+
+These tests cover summary lookup and incremental LangChain conversion,
+and check that neither writes framework bookkeeping into workflow state.
+"""
+
+import pytest
+from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
+
+from framework.memory import MemoryManager, LangChainMessageCache
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+@pytest.fixture
+def state():
+    """Initialized conversation with one exchange"""
+    state = {}
+    MemoryManager.init_conversation(state, "You are a test assistant.", max_messages=50)
+    MemoryManager.add_user_message(state, "Hello")
+    MemoryManager.add_assistant_message(state, "Hi there")
+    return state
+
+
+# ============================================================================
+# Test: Summary Lookup
+# ============================================================================
+
+class TestSummaryLookup:
+    """Test finding the summary message in the history"""
+    
+    def test_find_summary_index(self):
+        """Returns the index of the first summary message, or None"""
+        history = [
+            {'role': 'system', 'content': 's'},
+            {'role': 'user', 'content': 'u'},
+            {'role': 'summary', 'content': 'first'},
+            {'role': 'summary', 'content': 'second'},
+        ]
+        
+        assert MemoryManager._find_summary_index(history) == 2
+        assert MemoryManager._find_summary_index(history[:2]) is None
+        assert MemoryManager._find_summary_index([]) is None
+    
+    def test_get_summary_sees_direct_edits(self, state):
+        """Summaries inserted or removed outside MemoryManager are found"""
+        assert MemoryManager.get_summary(state) is None
+        
+        state['conversation_history'].insert(1, {'role': 'summary', 'content': 'earlier'})
+        assert MemoryManager.get_summary(state)['content'] == 'earlier'
+        
+        del state['conversation_history'][1]
+        assert MemoryManager.get_summary(state) is None
+    
+    def test_state_has_no_bookkeeping_keys(self, state):
+        """Only the documented memory fields are written to state"""
+        MemoryManager.add_summary_message(state, "summary")
+        MemoryManager.get_summary(state)
+        MemoryManager.clear_history(state)
+        
+        assert set(state) == {'conversation_history', '_memory_config'}
+
+
+# ============================================================================
+# Test: Incremental LangChain Conversion
+# ============================================================================
+
+class TestLangChainMessageCache:
+    """Test incremental conversion against the full conversion"""
+    
+    def _assert_same(self, converted, expected):
+        assert [(type(m), m.content) for m in converted] == \
+               [(type(m), m.content) for m in expected]
+    
+    def test_matches_full_conversion(self, state):
+        """Output equals get_langchain_messages(), summaries included"""
+        MemoryManager.add_summary_message(state, "Earlier topics")
+        cache = LangChainMessageCache()
+        
+        converted = cache.convert(MemoryManager.get_conversation_history(state))
+        
+        self._assert_same(converted, MemoryManager.get_langchain_messages(state))
+        assert [type(m) for m in converted] == [SystemMessage, HumanMessage, AIMessage, SystemMessage]
+    
+    def test_converts_only_new_messages(self, state):
+        """Earlier message objects are reused when messages are appended"""
+        cache = LangChainMessageCache()
+        first = list(cache.convert(state['conversation_history']))
+        
+        MemoryManager.add_user_message(state, "Another question")
+        second = cache.convert(state['conversation_history'])
+        
+        assert len(second) == len(first) + 1
+        assert all(a is b for a, b in zip(first, second))
+        self._assert_same(second, MemoryManager.get_langchain_messages(state))
+    
+    def test_rebuilds_after_last_message_edit(self, state):
+        """An edit of the last converted message is not served stale"""
+        cache = LangChainMessageCache()
+        cache.convert(state['conversation_history'])
+        
+        state['conversation_history'][-1]['content'] = "Edited"
+        converted = cache.convert(state['conversation_history'])
+        
+        assert converted[-1].content == "Edited"
+    
+    def test_rebuilds_after_summary_insert(self, state):
+        """Inserting a summary shifts the history and triggers a full rebuild"""
+        cache = LangChainMessageCache()
+        cache.convert(state['conversation_history'])
+        
+        state['conversation_history'].insert(1, {'role': 'summary', 'content': 'Earlier topics'})
+        converted = cache.convert(state['conversation_history'])
+        
+        self._assert_same(converted, MemoryManager.get_langchain_messages(state))
+    
+    def test_rebuilds_after_prune(self, state):
+        """Replacing the history (pruning, clearing) triggers a full rebuild"""
+        cache = LangChainMessageCache()
+        cache.convert(state['conversation_history'])
+        
+        MemoryManager.clear_history(state)
+        converted = cache.convert(state['conversation_history'])
+        
+        self._assert_same(converted, MemoryManager.get_langchain_messages(state))
+    
+    def test_clear_leaves_returned_list_intact(self, state):
+        """clear() starts a new list instead of emptying the one handed out"""
+        cache = LangChainMessageCache()
+        converted = cache.convert(state['conversation_history'])
+        
+        cache.clear()
+        
+        assert len(converted) == 3
+        assert len(cache.convert(state['conversation_history'])) == 3